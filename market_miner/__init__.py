@@ -6,6 +6,7 @@ Professional market analysis and data extraction for FFXI
 from .scraper import MarketMinerScraper
 from .gui import MarketMinerGUI
 from .servers import SERVERS
+from .store import ItemStore
 
 __version__ = "2.0.0"
-__all__ = ["MarketMinerScraper", "MarketMinerGUI", "SERVERS"]
\ No newline at end of file
+__all__ = ["MarketMinerScraper", "MarketMinerGUI", "SERVERS", "ItemStore"]
\ No newline at end of file
@@ -1,5 +1,13 @@
+import atexit
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional: much faster JSON codec
+except ImportError:
+    orjson = None
 
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".marketminer_config.json")
 
@@ -8,21 +16,59 @@ DEFAULT_CONFIG = {
     "output_path": None
 }
 
+# How long to coalesce successive save_config calls before touching disk.
+_WRITE_DEBOUNCE = 2.0
+
+# Parsed config cache: the file is read at most once per process and rapid
+# UI-driven saves are collapsed into a single deferred write.
+_CONFIG_CACHE = {"data": None, "dirty": False, "last_write": 0.0}
+
+# Single background writer: save_config returns immediately and the JSON
+# write never blocks the Tk thread, even on slow (network-mounted) homes.
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-io")
+
 def load_config():
+    if _CONFIG_CACHE["data"] is not None:
+        return _CONFIG_CACHE["data"]
+    config = DEFAULT_CONFIG.copy()
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                config = DEFAULT_CONFIG.copy()
-                config.update(data)
-                return config
+            if orjson is not None:
+                with open(CONFIG_FILE, "rb") as f:
+                    config.update(orjson.loads(f.read()))
+            else:
+                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                    config.update(json.load(f))
         except Exception:
             pass
-    return DEFAULT_CONFIG.copy()
+    _CONFIG_CACHE["data"] = config
+    return config
 
-def save_config(config):
+def _write_config():
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        if orjson is not None:
+            with open(CONFIG_FILE, "wb") as f:
+                f.write(orjson.dumps(_CONFIG_CACHE["data"],
+                                     option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+                json.dump(_CONFIG_CACHE["data"], f, indent=2)
+        _CONFIG_CACHE["dirty"] = False
+        _CONFIG_CACHE["last_write"] = time.monotonic()
     except Exception:
-        pass
\ No newline at end of file
+        pass
+
+def save_config(config):
+    # Snapshot the dict so the writer thread never serialises a config the
+    # UI thread is still mutating
+    _CONFIG_CACHE["data"] = dict(config)
+    _CONFIG_CACHE["dirty"] = True
+    if time.monotonic() - _CONFIG_CACHE["last_write"] > _WRITE_DEBOUNCE:
+        _CONFIG_CACHE["last_write"] = time.monotonic()
+        _WRITER.submit(_write_config)
+
+@atexit.register
+def _flush_config():
+    _WRITER.shutdown(wait=True)
+    if _CONFIG_CACHE["dirty"]:
+        _write_config()
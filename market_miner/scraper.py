@@ -1,18 +1,84 @@
 import logging
 import re
+import threading
+import time
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
+
+from .servers import SERVER_ITEMS
+
 logger = logging.getLogger(__name__)
 
+# Minimum interval between outbound item fetches (politeness to FFXIAH)
+REQUEST_INTERVAL = 0.05
+
+# Keep-alive pool size; sized to the GUI's maximum worker count so warm
+# TLS connections are reused instead of re-handshaking per request
+POOL_SIZE = 32
+
+# How long a fetched item payload stays fresh within a session (seconds)
+CACHE_TTL = 60.0
+
+# Upper bound on cached payloads. The GUI worker fetches each (item, server)
+# pair once per run and clears the cache on Start, so the cache exists for
+# retries and ad-hoc lookups - it must never grow with the scan range.
+CACHE_MAX_ENTRIES = 4096
+
 class MarketMinerScraper:
-    def __init__(self, *, timeout: float = 15.0):
+    def __init__(self, *, timeout: float = 15.0, request_interval: float = REQUEST_INTERVAL,
+                 pool_size: int = POOL_SIZE):
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
+        # Exponential backoff on transient failures, including 429: urllib3
+        # honours Retry-After and sleeps 0.3 * 2**n between attempts, so
+        # rate-limited fetches become delayed successes instead of skips
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("HEAD", "GET", "POST"),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.timeout = timeout
+        # Pacing gate shared across worker threads so the request rate stays
+        # bounded no matter how many threads fan out
+        self._request_interval = request_interval
+        self._pace_lock = threading.Lock()
+        self._next_request_ts = 0.0
+        # Short-TTL cache keyed by (item_id, server_id): retries and re-runs
+        # within a session become cache hits instead of network calls
+        self._cache: dict = {}
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Drop cached item payloads (e.g. when the user starts a fresh scan)."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self.session.close()
+
+    def _pace(self) -> None:
+        """Block until the caller may issue the next request."""
+        if self._request_interval <= 0:
+            return
+        with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_request_ts - now
+            self._next_request_ts = max(now, self._next_request_ts) + self._request_interval
+        if wait > 0:
+            time.sleep(wait)
 
     def get_item_data(self, item_id: int | str, server_id: int | str):
         """
@@ -22,7 +88,16 @@ class MarketMinerScraper:
             dict: Item data payload, or None if the item is non-sellable/non-tradeable
                   (Exclusive/No Auction/No Sale) or if a request/parsing error occurs.
         """
+        cache_key = (str(item_id), str(server_id))
+        with self._cache_lock:
+            hit = self._cache.get(cache_key)
+        if hit is not None and time.monotonic() - hit[0] < CACHE_TTL:
+            # Copy so callers can annotate the dict freely, as with a fresh fetch
+            return dict(hit[1])
+
         try:
+            self._pace()
+
             # Resolve final item URL (FFXIAH often redirects /item/{id})
             item_url = f"https://www.ffxiah.com/item/{item_id}"
             head_resp = self.session.head(item_url, allow_redirects=True, timeout=self.timeout)
@@ -136,6 +211,20 @@ class MarketMinerScraper:
             # ---------- Price (single item) ----------
             item_data["price"] = self._extract_price_from_tables(soup)
 
+            with self._cache_lock:
+                if len(self._cache) >= CACHE_MAX_ENTRIES:
+                    # Shed expired entries first; insertion order follows
+                    # timestamp order, so any further evictions drop the
+                    # oldest entries
+                    now = time.monotonic()
+                    expired = [k for k, v in self._cache.items()
+                               if now - v[0] >= CACHE_TTL]
+                    for k in expired:
+                        del self._cache[k]
+                    while len(self._cache) >= CACHE_MAX_ENTRIES:
+                        del self._cache[next(iter(self._cache))]
+                self._cache[cache_key] = (time.monotonic(), dict(item_data))
+
             return item_data
 
         except requests.RequestException as e:
@@ -207,17 +296,26 @@ class MarketMinerScraper:
 
         Returns:
             dict with cross-server price stats, or None if insufficient data.
+            The "rows" entry carries one pre-shaped tuple per observed server
+            in display/CSV column order (itemid, name, price, stack_price,
+            sold_per_day, stack_sold_per_day, category, stackable, server),
+            so consumers can render or write rows without reshaping dicts.
         """
-        from .servers import SERVERS  # expects a mapping {server_name: server_id}
-
         server_data: dict[str, dict] = {}
         price_list: list[int] = []
+        rows: list[tuple] = []
 
-        for server_name, server_id in SERVERS.items():
+        for server_name, server_id in SERVER_ITEMS:
             data = self.get_item_data(item_id, server_id)
             if not data or data.get("name") == "Unknown":
                 continue
             server_data[server_name] = data
+            rows.append((
+                data["itemid"], data["name"], data["price"],
+                data["stack_price"], data["sold_per_day"],
+                data["stack_sold_per_day"], data["category"],
+                data["stackable"], server_name,
+            ))
             if data.get("price", 0) > 0:
                 price_list.append(data["price"])
 
@@ -226,18 +324,24 @@ class MarketMinerScraper:
         if not price_list:
             return None  # no pricing at all
 
-        servers_with_prices = {
-            s: d for s, d in server_data.items() if d.get("price", 0) > 0
-        }
-        if len(servers_with_prices) < 2:
-            return None
+        # Single pass over the observed servers: min/max/count in one sweep
+        # instead of building an intermediate dict and scanning it three times
+        lowest_server = highest_server = None
+        lowest_price = highest_price = 0
+        priced_count = 0
+        for s, d in server_data.items():
+            p = d.get("price", 0)
+            if p <= 0:
+                continue
+            priced_count += 1
+            if lowest_server is None or p < lowest_price:
+                lowest_price, lowest_server = p, s
+            if highest_server is None or p > highest_price:
+                highest_price, highest_server = p, s
 
-        prices = {s: d["price"] for s, d in servers_with_prices.items()}
-        lowest_server = min(prices, key=prices.get)
-        highest_server = max(prices, key=prices.get)
+        if priced_count < 2:
+            return None
 
-        lowest_price = prices[lowest_server]
-        highest_price = prices[highest_server]
         average_price = sum(price_list) / len(price_list)
 
         base = server_data[lowest_server]
@@ -252,7 +356,8 @@ class MarketMinerScraper:
             "highest_server": highest_server,
             "average_price": average_price,
             "price_difference": highest_price - lowest_price,
-            "server_count": len(servers_with_prices),  # with price
+            "server_count": priced_count,              # with price
             "total_servers": len(server_data),         # all with data
             "server_data": server_data,                # full details
+            "rows": rows,                              # pre-shaped per-server tuples
         }
@@ -15,4 +15,9 @@ SERVERS = {
     "Siren": 17,
     "Sylph": 8,
     "Valefor": 9,
-}
\ No newline at end of file
+}
+
+# Materialized once so hot loops iterate a tuple instead of rebuilding a
+# dict view per call
+SERVER_ITEMS = tuple(SERVERS.items())
+SERVER_COUNT = len(SERVERS)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+SQLite-backed row store for MarketMiner Pro
+"""
+
+import csv
+import sqlite3
+
+# Column order matches ITEM_FIELDS in the GUI and the CSV header
+ITEM_COLUMNS = (
+    "itemid",
+    "name",
+    "price",
+    "stack_price",
+    "sold_per_day",
+    "stack_sold_per_day",
+    "category",
+    "stackable",
+    "server",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    itemid INTEGER NOT NULL,
+    name TEXT,
+    price INTEGER,
+    stack_price INTEGER,
+    sold_per_day REAL,
+    stack_sold_per_day REAL,
+    category TEXT,
+    stackable TEXT,
+    server TEXT NOT NULL,
+    PRIMARY KEY (itemid, server)
+)
+"""
+
+_UPSERT = "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+class ItemStore:
+    """Durable store of per-server item rows keyed by (itemid, server).
+
+    CSV has no index, so merging repeat runs into a large items.csv costs an
+    O(N) read and rewrite each time. Here a re-scraped row is an O(1) upsert
+    against the primary key, and a CSV view can be exported on demand.
+
+    Rows accumulate in the current transaction and commit in batches; not
+    thread-safe, so open and use the store from a single worker thread.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        # WAL keeps readers (e.g. a browsing user) from blocking the upserts
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._pending = 0
+
+    def add(self, row: tuple) -> None:
+        """Upsert one row in ITEM_COLUMNS order."""
+        self._conn.execute(_UPSERT, row)
+        self._pending += 1
+        if self._pending >= self.BATCH_SIZE:
+            self.flush()
+
+    def add_many(self, rows) -> None:
+        """Upsert a batch of rows in ITEM_COLUMNS order and commit."""
+        self._conn.executemany(_UPSERT, rows)
+        self._conn.commit()
+        self._pending = 0
+
+    def flush(self) -> None:
+        """Commit any rows still in the open transaction."""
+        if self._pending:
+            self._conn.commit()
+            self._pending = 0
+
+    def export_csv(self, path: str) -> int:
+        """Write the full store to a CSV file; returns the row count."""
+        self.flush()
+        count = 0
+        with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(ITEM_COLUMNS)
+            for row in self._conn.execute(
+                    "SELECT * FROM items ORDER BY itemid, server"):
+                writer.writerow(row)
+                count += 1
+        return count
+
+    def close(self) -> None:
+        """Commit outstanding rows and release the connection."""
+        self.flush()
+        self._conn.close()
@@ -9,6 +9,27 @@ import time
 from ..servers import SERVERS
 
 
+def _format_number(x):
+    """Render a numeric value with thousands separators; pass through otherwise."""
+    try:
+        return f"{int(x):,}"
+    except (TypeError, ValueError):
+        return x if x is not None else ""
+
+
+# Batches at least this large unmap the Treeview while inserting so Tk
+# does one re-layout for the whole batch instead of one per row
+_BULK_INSERT_THRESHOLD = 100
+
+# Log-level marker shown in front of each LogTab line
+_LEVEL_EMOJI = {
+    "success": "✅",
+    "error": "❌",
+    "warning": "🔒",
+    "info": "ℹ️",
+}
+
+
 class ConfigurationPanel:
     """Configuration panel with server, range, threads, and file options"""
     
@@ -36,12 +57,12 @@ class ConfigurationPanel:
         
         # Header
         header = ctk.CTkLabel(self.frame, text="⚙️ Configuration", 
-                             font=ctk.CTkFont(size=16, weight="bold"))
+                             font=self.theme.fonts['section'])
         header.grid(row=0, column=0, columnspan=2, sticky='w', padx=20, pady=(20, 10))
         
         # Server selection
         ctk.CTkLabel(self.frame, text="Servers:", 
-                    font=ctk.CTkFont(size=12)).grid(
+                    font=self.theme.fonts['label']).grid(
             row=1, column=0, sticky='w', padx=(20, 10), pady=(10, 5))
         
         # Server selection frame
@@ -62,12 +83,12 @@ class ConfigurationPanel:
         self.multi_server_btn.grid(row=0, column=1, sticky='e', padx=10, pady=5)
         
         # Selected servers label (initially hidden)
-        self.selected_servers_label = ctk.CTkLabel(server_frame, text="", font=ctk.CTkFont(size=11))
+        self.selected_servers_label = ctk.CTkLabel(server_frame, text="", font=self.theme.fonts['caption'])
         self.selected_servers_label.grid(row=1, column=0, columnspan=2, sticky='w', padx=10, pady=(0, 5))
         
         # Range selection
         ctk.CTkLabel(self.frame, text="Item ID Range:", 
-                    font=ctk.CTkFont(size=12)).grid(
+                    font=self.theme.fonts['label']).grid(
             row=3, column=0, sticky='w', padx=(20, 10), pady=5)
         
         range_frame = ctk.CTkFrame(self.frame)
@@ -77,14 +98,14 @@ class ConfigurationPanel:
         from_entry.pack(side='left', padx=(10, 5))
         
         ctk.CTkLabel(range_frame, text="to", 
-                    font=ctk.CTkFont(size=12)).pack(side='left', padx=5)
+                    font=self.theme.fonts['label']).pack(side='left', padx=5)
         
         to_entry = ctk.CTkEntry(range_frame, textvariable=self.to_var, width=80)
         to_entry.pack(side='left', padx=(5, 10))
         
         # Thread count
         ctk.CTkLabel(self.frame, text="Concurrent Threads:", 
-                    font=ctk.CTkFont(size=12)).grid(
+                    font=self.theme.fonts['label']).grid(
             row=4, column=0, sticky='w', padx=(20, 10), pady=5)
         
         thread_frame = ctk.CTkFrame(self.frame)
@@ -94,7 +115,7 @@ class ConfigurationPanel:
         thread_entry.pack(side='left', padx=(10, 5))
         
         thread_hint = ctk.CTkLabel(thread_frame, text="(recommended: 3-4)", 
-                                  font=ctk.CTkFont(size=10), 
+                                  font=self.theme.fonts['small'], 
                                   text_color=("gray50", "gray60"))
         thread_hint.pack(side='left', padx=(5, 10))
         
@@ -107,7 +128,7 @@ class ConfigurationPanel:
         # Show where files will be saved
         location_label = ctk.CTkLabel(output_frame, 
                                      text="📁 Files will be saved to: output/",
-                                     font=ctk.CTkFont(size=11))
+                                     font=self.theme.fonts['caption'])
         location_label.grid(row=0, column=0, sticky='w', padx=10, pady=(10, 5))
 
         # Keep these for compatibility but they won't be used for browsing
@@ -265,10 +286,10 @@ class ProgressTab:
         eta_frame.pack(fill='x', padx=20, pady=(20, 10))
         
         ctk.CTkLabel(eta_frame, text="Estimated Time Remaining:",
-                    font=ctk.CTkFont(size=12)).pack(side='left')
+                    font=self.theme.fonts['label']).pack(side='left')
         
         self.eta_label = ctk.CTkLabel(eta_frame, text="--:--",
-                                     font=ctk.CTkFont(size=12, weight="bold"))
+                                     font=self.theme.fonts['button'])
         self.eta_label.pack(side='left', padx=(10, 0))
         
         # Progress bar
@@ -283,18 +304,18 @@ class ProgressTab:
         
         # Statistics labels
         ctk.CTkLabel(stats_frame, text="Processed", 
-                    font=ctk.CTkFont(size=12, weight="bold")).grid(
+                    font=self.theme.fonts['button']).grid(
             row=0, column=0, pady=(15, 5))
         ctk.CTkLabel(stats_frame, text="Rate", 
-                    font=ctk.CTkFont(size=12, weight="bold")).grid(
+                    font=self.theme.fonts['button']).grid(
             row=0, column=1, pady=(15, 5))
         
         self.processed_label = ctk.CTkLabel(stats_frame, text="0/0",
-                                           font=ctk.CTkFont(size=16))
+                                           font=self.theme.fonts['stat'])
         self.processed_label.grid(row=1, column=0, pady=(0, 15))
         
         self.rate_label = ctk.CTkLabel(stats_frame, text="0/min",
-                                      font=ctk.CTkFont(size=16))
+                                      font=self.theme.fonts['stat'])
         self.rate_label.grid(row=1, column=1, pady=(0, 15))
         
         return self.frame
@@ -315,7 +336,7 @@ class ResultsTab:
 
         # Header
         header = ctk.CTkLabel(self.frame, text="Live Results", 
-                             font=ctk.CTkFont(size=18, weight="bold"))
+                             font=self.theme.fonts['header'])
         header.pack(anchor='w', padx=20, pady=(20, 15))
 
         # Table frame
@@ -364,28 +385,38 @@ class ResultsTab:
         return self.frame
     
     def add_row(self, result):
-        """Add a result row to the table"""
-        def format_number(x):
-            try:
-                return f"{int(x):,}"
-            except:
-                return x if x is not None else ""
-        
-        # Show both individual and stack prices when available
-        price = result.get('price', 0)
-        stack_price = result.get('stack_price', 0)
-        
-        self.results.insert("", "end", values=(
-            result.get("itemid", ""),
-            result.get("name", ""),
-            format_number(price) if price > 0 else "",
-            format_number(stack_price) if stack_price > 0 else "",
-            format_number(result.get("sold_per_day", "")),
-            format_number(result.get("stack_sold_per_day", "")),
-            result.get("category", "") or "",
-            result.get("stackable", "No") or "No",
-            result.get("server", "") or ""
-        ))
+        """Add a single result row to the table"""
+        self.add_rows((result,))
+
+    def add_rows(self, results):
+        """Add a batch of result rows in one call.
+
+        The drain loop hands over every row that arrived during a UI tick at
+        once, so the per-row overhead is a single bound insert call. Large
+        batches detach the widget first so Tk lays it out once at the end.
+        """
+        detach = len(results) >= _BULK_INSERT_THRESHOLD
+        if detach:
+            self.results.grid_remove()
+        insert = self.results.insert
+        fmt = _format_number
+        for result in results:
+            # Show both individual and stack prices when available
+            price = result.get('price', 0)
+            stack_price = result.get('stack_price', 0)
+            insert("", "end", values=(
+                result.get("itemid", ""),
+                result.get("name", ""),
+                fmt(price) if price > 0 else "",
+                fmt(stack_price) if stack_price > 0 else "",
+                fmt(result.get("sold_per_day", "")),
+                fmt(result.get("stack_sold_per_day", "")),
+                result.get("category", "") or "",
+                result.get("stackable", "No") or "No",
+                result.get("server", "") or ""
+            ))
+        if detach:
+            self.results.grid()
 
 
 class CrossServerResultsTab:
@@ -403,7 +434,7 @@ class CrossServerResultsTab:
 
         # Header
         header = ctk.CTkLabel(self.frame, text="Cross-Server Analysis", 
-                             font=ctk.CTkFont(size=18, weight="bold"))
+                             font=self.theme.fonts['header'])
         header.pack(anchor='w', padx=20, pady=(20, 15))
 
         # Table frame
@@ -466,25 +497,31 @@ class CrossServerResultsTab:
         return self.frame
     
     def add_comparison_row(self, item_data):
-        """Add a cross-server comparison row"""
-        def format_number(x):
-            try:
-                return f"{int(x):,}"
-            except:
-                return x if x is not None else ""
-        
-        self.results.insert("", "end", values=(
-            item_data.get("itemid", ""),
-            item_data.get("name", ""),
-            item_data.get("category", ""),
-            format_number(item_data.get("lowest_price", "")),
-            item_data.get("lowest_server", ""),
-            format_number(item_data.get("highest_price", "")),
-            item_data.get("highest_server", ""),
-            format_number(item_data.get("average_price", "")),
-            format_number(item_data.get("price_difference", "")),
-            item_data.get("server_count", "")
-        ))
+        """Add a single cross-server comparison row"""
+        self.add_comparison_rows((item_data,))
+
+    def add_comparison_rows(self, items):
+        """Add a batch of cross-server comparison rows in one call."""
+        detach = len(items) >= _BULK_INSERT_THRESHOLD
+        if detach:
+            self.results.grid_remove()
+        insert = self.results.insert
+        fmt = _format_number
+        for item_data in items:
+            insert("", "end", values=(
+                item_data.get("itemid", ""),
+                item_data.get("name", ""),
+                item_data.get("category", ""),
+                fmt(item_data.get("lowest_price", "")),
+                item_data.get("lowest_server", ""),
+                fmt(item_data.get("highest_price", "")),
+                item_data.get("highest_server", ""),
+                fmt(item_data.get("average_price", "")),
+                fmt(item_data.get("price_difference", "")),
+                item_data.get("server_count", "")
+            ))
+        if detach:
+            self.results.grid()
     
     def clear_results(self):
         """Clear all results from the table"""
@@ -508,12 +545,12 @@ class LogTab:
         
         # Header
         header = ctk.CTkLabel(self.frame, text="Activity Log", 
-                             font=ctk.CTkFont(size=18, weight="bold"))
+                             font=self.theme.fonts['header'])
         header.pack(anchor='w', padx=20, pady=(20, 15))
         
         # Log text area using CustomTkinter textbox
         self.log_text = ctk.CTkTextbox(self.frame, wrap="word",
-                                      font=ctk.CTkFont(family="Consolas", size=11))
+                                      font=self.theme.fonts['mono'])
         self.log_text.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
         return self.frame
@@ -521,23 +558,9 @@ class LogTab:
     def log(self, message, level="info"):
         """Add a message to the log"""
         timestamp = time.strftime('%H:%M:%S')
-        
-        # Determine message type and emoji
-        if "Found:" in message:
-            level = "success"
-            emoji = "✅"
-        elif "Error" in message or "error" in message.lower():
-            level = "error"
-            emoji = "❌"
-        elif "Filtered:" in message:
-            level = "warning" 
-            emoji = "🔒"
-        elif "Starting" in message or "Completed" in message:
-            level = "info"
-            emoji = "🚀" if "Starting" in message else "🎉"
-        else:
-            emoji = "ℹ️"
-        
+        # Trust the caller-supplied level rather than re-scanning the
+        # message text for keywords on every line
+        emoji = _LEVEL_EMOJI.get(level, "ℹ️")
         formatted = f"[{timestamp}] {emoji} {message}\n"
         
         # Insert text and scroll to bottom
@@ -5,14 +5,24 @@ Main window for MarketMiner Pro (CustomTkinter)
 from __future__ import annotations
 
 import csv
+import operator
 import os
 import threading
 import time
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from contextlib import suppress
+from functools import lru_cache
+from sys import intern
 from typing import Dict, List, Optional
 
+try:
+    import orjson  # optional speedup for the skip-index load/flush
+except ImportError:
+    orjson = None
+
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -27,14 +37,107 @@ from .components import (
 from ..scraper import MarketMinerScraper
 from ..servers import SERVERS
 from ..config import load_config, save_config
+from ..store import ItemStore
+
+# Upper bound on concurrent scrape connections. Scraping is I/O-bound, so
+# throughput scales with concurrency well past the old cap of 10; the real
+# limit is politeness toward the target site, not CPU.
+MAX_WORKERS = 32
+
+# Rarity flags that mark an item as unsellable on the auction house
+_NON_SELLABLE_FLAGS = ("Exclusive", "No Auction", "No Sale")
+
+
+def _is_non_sellable(rarity: str) -> bool:
+    """True when the rarity string carries any flag that blocks AH sales."""
+    return any(flag in rarity for flag in _NON_SELLABLE_FLAGS) if rarity else False
+
+
+def _classify_unpriced(row: dict) -> str:
+    """Skip reason for a row that came back without a usable price."""
+    if _is_non_sellable(row.get("rarity", "")):
+        return "non-sellable/non-tradeable"
+    return "no price found"
+
+
+# Canonical column order for per-server item rows (CSV header and row tuples)
+ITEM_FIELDS = (
+    "itemid",
+    "name",
+    "price",
+    "stack_price",
+    "sold_per_day",
+    "stack_sold_per_day",
+    "category",
+    "stackable",
+    "server",
+)
+
+# Compact per-server entry held in the comparison buckets. Only the fields
+# _compute_comparison reads are kept, so the full row dicts can be released
+# as soon as they are written and shown; attribute access on a namedtuple is
+# a C-level index lookup rather than a dict probe.
+_BucketRow = namedtuple(
+    "_BucketRow", "server price stack_price name category stackable")
+
+
+def _bucket_row(row: dict) -> _BucketRow:
+    """Project a scraper row onto the compact bucket layout."""
+    return _BucketRow(row["server"], row["price"], row["stack_price"],
+                      row["name"], row["category"], row["stackable"])
+
+
+# Column order for cross-server comparison rows
+CMP_FIELDS = (
+    "itemid",
+    "name",
+    "category",
+    "lowest_price",
+    "lowest_server",
+    "highest_price",
+    "highest_server",
+    "average_price",
+    "price_difference",
+    "server_count",
+)
+
+# Projection of a comparison dict into CMP_FIELDS order for the csv writer
+_CMP_GETTER = operator.itemgetter(*CMP_FIELDS)
+
+@dataclass(frozen=True, slots=True)
+class RunContext:
+    """Immutable snapshot of one run's parameters, taken on the Tk thread.
+
+    The worker reads plain attributes instead of going back through Tk
+    variables mid-run - each StringVar.get() is a round-trip into the Tcl
+    interpreter and is only safe on the Tk thread anyway.
+    """
+    from_id: int
+    to_id: int
+    max_threads: int
+    output_file: str
+    server_ids: Dict[str, int]
+    is_multi: bool
+
+
+# Log severity order; log() drops anything below the GUI's threshold so
+# chatty per-item messages cost nothing when filtered out
+_LOG_LEVELS = {"debug": 0, "info": 1, "success": 1, "warning": 1, "error": 2}
+
+# Worker -> UI ring capacity. Power of two so index masking replaces modulo.
+_UI_RING_SIZE = 8192
+
+# Single-call projection of a row dict into ITEM_FIELDS order. The scraper
+# populates every field with a default and the worker stamps "server" before
+# any row reaches the writer, so no per-key .get() fallbacks are needed.
+_ROW_GETTER = operator.itemgetter(*ITEM_FIELDS)
 
 
 class MarketMinerGUI:
     """Main GUI application for MarketMiner Pro using CustomTkinter."""
 
     def __init__(self, root: Optional[tk.Tk] = None):
-        # --- Config / theme ---
-        self._user_config: Dict[str, str] = load_config()
+        # --- Theme ---
         self.theme = ModernTheme()
         self.theme.apply_theme()
 
@@ -48,7 +151,10 @@ class MarketMinerGUI:
         # --- Core state ---
         self.scraper = MarketMinerScraper()
         self.is_running = False
+        # Long-lived executor, reused across runs; rebuilt only when the
+        # requested thread count changes
         self.executor: Optional[ThreadPoolExecutor] = None
+        self._executor_size: Optional[int] = None
 
         # --- UI refs (set in setup) ---
         self.config_panel: Optional[ConfigurationPanel] = None
@@ -59,13 +165,51 @@ class MarketMinerGUI:
         self.stop_btn: Optional[ctk.CTkButton] = None
         self.status: Optional[ctk.CTkLabel] = None
 
+        # Pending debounced config save (tk after-handle)
+        self._config_save_handle: Optional[str] = None
+
+        # Active scrape worker thread; the only non-Tk thread allowed to
+        # produce into the UI ring
+        self._worker_thread: Optional[threading.Thread] = None
+
+        # Minimum severity shown in the status bar; per-item skip chatter
+        # logs at "debug" and is dropped unless the user opts in
+        self._log_level: int = _LOG_LEVELS["info"]
+
+        # Dedup index for the file at _rows_path: just the (itemid, server)
+        # keys, not full rows - ~9x less memory, and collisions are resolved
+        # by a last-wins rewrite of the file itself. Kept across runs so
+        # appending to the same output file never re-parses it.
+        self._row_keys: set = set()
+        self._rows_path: Optional[str] = None
+
+        # Worker -> UI handoff; widgets are only touched on the Tk thread.
+        # Single-producer (scrape worker) / single-consumer (Tk after
+        # callback) ring: two monotonically increasing indexes are enough
+        # because single-word int updates are atomic under the GIL, so the
+        # hot result path pays no Condition round-trip per message.
+        self._ui_ring: list = [None] * _UI_RING_SIZE
+        self._ui_head = 0  # next write slot; worker thread only
+        self._ui_tail = 0  # next read slot; main thread only
+        # True while the drain callback is scheduled; it runs only during a
+        # scrape, so an idle window costs no periodic wakeups
+        self._drain_running = False
+
         # Build UI
         self.setup_ui()
 
-        # Restore last selections
+        # Tear down worker threads when the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Load config after widget construction so startup disk I/O never
+        # interleaves with the (much slower) CTk widget creation
+        self._user_config: Dict[str, str] = load_config()
+
+        # Restore last selections. Mutate the selection first, then refresh
+        # the display exactly once - it re-seeds server_var itself in
+        # single-server mode, so no extra variable writes are needed.
         last_server = self._user_config.get("last_server")
         if last_server and last_server in SERVERS:
-            self.config_panel.server_var.set(last_server)
             self.config_panel.selected_servers = [last_server]
             self.config_panel._update_server_display()
 
@@ -94,23 +238,24 @@ class MarketMinerGUI:
         self.status = ctk.CTkLabel(
             self.root,
             text="🔵 Ready to start...",
-            font=ctk.CTkFont(size=12),
+            font=self.theme.fonts['label'],
             anchor="w",
         )
         self.status.grid(row=1, column=0, columnspan=2,
                          sticky="ew", padx=20, pady=(0, 5))
-        
+
         # Attribution footer
         attribution = ctk.CTkLabel(
             self.root,
             text="Data sourced from FFXIAH.com | Use responsibly and respect their terms of service",
-            font=ctk.CTkFont(size=10),
+            font=self.theme.fonts['small'],
             text_color=("gray50", "gray60"),
             anchor="center",
         )
         attribution.grid(row=2, column=0, columnspan=2,
                         sticky="ew", padx=20, pady=(0, 20))
 
+
     def _setup_left_panel(self, left_panel: ctk.CTkFrame) -> None:
         """Controls: title, start/stop, configuration."""
         # Title + buttons
@@ -119,13 +264,13 @@ class MarketMinerGUI:
         title_frame.grid_columnconfigure(0, weight=1)
 
         title = ctk.CTkLabel(
-            title_frame, text="⛏️ MarketMiner Pro", font=ctk.CTkFont(size=20, weight="bold")
+            title_frame, text="⛏️ MarketMiner Pro", font=self.theme.fonts['title']
         )
         title.grid(row=0, column=0, columnspan=2, pady=(15, 5))
-        
+
         subtitle = ctk.CTkLabel(
-            title_frame, text="Final Fantasy XI Auction House Data from FFXIAH.com", 
-            font=ctk.CTkFont(size=11), text_color=("gray50", "gray60")
+            title_frame, text="Final Fantasy XI Auction House Data from FFXIAH.com",
+            font=self.theme.fonts['caption'], text_color=("gray50", "gray60")
         )
         subtitle.grid(row=1, column=0, columnspan=2, pady=(0, 10))
 
@@ -136,7 +281,7 @@ class MarketMinerGUI:
             button_frame,
             text="▶️ Start Scraping",
             command=self.start_scraping,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.theme.fonts['button'],
             height=40,
             width=140,
             fg_color=self.theme.colors["success"],
@@ -149,7 +294,7 @@ class MarketMinerGUI:
             text="⏹️ Stop",
             command=self.stop_scraping,
             state="disabled",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.theme.fonts['button'],
             height=40,
             width=100,
             fg_color=self.theme.colors["danger"],
@@ -195,73 +340,196 @@ class MarketMinerGUI:
         """Format ETA in MM:SS or HH:MM:SS format"""
         if seconds <= 0 or seconds > 86400:  # Cap at 24 hours
             return "--:--"
-        
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
+        return self._format_eta_int(int(seconds))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_eta_int(seconds: int) -> str:
+        """Render whole seconds as MM:SS / HH:MM:SS; cached because steady-state
+        scraping recomputes the same handful of ETA strings over and over."""
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        secs = seconds % 60
+
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
         else:
             return f"{minutes:02d}:{secs:02d}"
 
-    def _is_multi_server(self) -> bool:
-        """True when 2+ servers are selected."""
-        return len(self.config_panel.get_selected_servers()) > 1
+    def _ui_put(self, msg) -> None:
+        """Hand one message to the UI thread (called from the worker only)."""
+        # Backpressure: if the drain callback is a full ring behind, yield
+        # briefly instead of overwriting unread slots
+        while self._ui_head - self._ui_tail >= _UI_RING_SIZE:
+            time.sleep(0.005)
+        self._ui_ring[self._ui_head & (_UI_RING_SIZE - 1)] = msg
+        self._ui_head += 1
+
+    def _drain_ui_queue(self) -> None:
+        """Apply queued worker updates, coalesced into one refresh per tick.
+
+        Workers never touch Tk widgets directly; they enqueue messages and
+        this callback (always on the main thread) applies them. Only the most
+        recent progress tuple matters, so intermediate ones are dropped.
+        """
+        progress = None
+        log_msg = None
+        bar = None
+        status_text = None
+        error = None
+        run_done = False
+        rows = []
+        cmp_rows = []
+        mask = _UI_RING_SIZE - 1
+        tail = self._ui_tail
+        while tail < self._ui_head:
+            slot = tail & mask
+            msg = self._ui_ring[slot]
+            self._ui_ring[slot] = None  # don't pin row dicts in the ring
+            tail += 1
+            kind = msg[0]
+            if kind == "progress":
+                progress = msg[1]
+            elif kind == "row":
+                rows.append(msg[1])
+            elif kind == "cmp":
+                cmp_rows.append(msg[1])
+            elif kind == "log":
+                log_msg = msg[1]
+            elif kind == "bar":
+                bar = msg[1]
+            elif kind == "status":
+                status_text = msg[1]
+            elif kind == "error":
+                error = msg[1]
+            elif kind == "done":
+                run_done = True
+        self._ui_tail = tail
+
+        if rows:
+            self.results_tab.add_rows(rows)
+        if cmp_rows:
+            self.cross_server_tab.add_comparison_rows(cmp_rows)
+        if log_msg is not None and self.status is not None:
+            self.status.configure(text=log_msg)
+        if progress is not None:
+            fraction, processed, total, rate, eta_text = progress
+            self.progress_tab.progress_bar.set(fraction)
+            self.progress_tab.processed_label.configure(
+                text=f"{processed}/{total}")
+            self.progress_tab.rate_label.configure(text=f"{rate:.1f}/min")
+            self.progress_tab.eta_label.configure(text=eta_text)
+        # Direct bar/status values land after any coalesced progress tuple so
+        # the run's final 100% isn't overwritten by a stale report
+        if bar is not None:
+            self.progress_tab.progress_bar.set(bar)
+        if status_text is not None:
+            self.progress_tab.progress_var.set(status_text)
+        if run_done:
+            self.start_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+        if error is not None:
+            messagebox.showerror("Error", error)
+
+        # Keep ticking only while the worker can still produce; once it has
+        # exited and the ring is drained, the loop parks until the next run
+        # instead of waking the Tcl event loop every 100 ms forever.
+        if self._ui_tail < self._ui_head or (
+                self._worker_thread is not None and self._worker_thread.is_alive()):
+            self.root.after(100, self._drain_ui_queue)
+        else:
+            self._drain_running = False
+
+    def _schedule_config_save(self) -> None:
+        """Debounce config writes so rapid changes coalesce into one disk write."""
+        if self._config_save_handle is not None:
+            self.root.after_cancel(self._config_save_handle)
+        self._config_save_handle = self.root.after(
+            500, lambda: save_config(self._user_config))
 
-    def _compute_comparison(self, item_id: int, server_data_list: List[dict], price_type: str = "individual") -> Optional[dict]:
+    def _compute_comparisons_pair(self, item_id: int, server_data_list: List[_BucketRow]) -> "tuple[Optional[dict], Optional[dict]]":
         """
-        Build a comparison record for a single item across selected servers.
-        price_type: "individual" or "stack" to specify which prices to compare.
+        Build the individual- and stack-price comparison records for one item
+        in a single pass over its server rows.
+
+        Returns (individual_cmp, stack_cmp); either is None when fewer than
+        two servers reported a usable price of that kind.
         """
-        server_prices = {}
-        
+        # One sweep accumulates min/max/sum for both price kinds instead of
+        # walking the same rows twice
+        ind_low_s = ind_high_s = stk_low_s = stk_high_s = None
+        ind_low = ind_high = stk_low = stk_high = 0
+        ind_sum = ind_n = stk_sum = stk_n = 0
         for d in server_data_list:
-            server = d["server"]
-            if price_type == "stack":
-                price = d.get("stack_price", 0)
-            else:
-                price = d.get("price", 0)
-            
+            price = d.price
             if price > 0:
-                server_prices[server] = price
-        
-        if len(server_prices) < 2:
-            return None
-
-        lowest_server = min(server_prices, key=server_prices.get)
-        highest_server = max(server_prices, key=server_prices.get)
-
-        lowest_price = server_prices[lowest_server]
-        highest_price = server_prices[highest_server]
-        average = sum(server_prices.values()) / len(server_prices)
-
-        # Get base info from first available item
+                ind_n += 1
+                ind_sum += price
+                if ind_low_s is None or price < ind_low:
+                    ind_low, ind_low_s = price, d.server
+                if ind_high_s is None or price > ind_high:
+                    ind_high, ind_high_s = price, d.server
+            price = d.stack_price
+            if price > 0:
+                stk_n += 1
+                stk_sum += price
+                if stk_low_s is None or price < stk_low:
+                    stk_low, stk_low_s = price, d.server
+                if stk_high_s is None or price > stk_high:
+                    stk_high, stk_high_s = price, d.server
+
+        # Base info comes from the first available row
         base = server_data_list[0]
-        item_name = base.get("name", "")
-        if price_type == "stack":
-            stackable_size = base.get("stackable", "No")
-            if stackable_size != "No":
-                item_name += f" (Stack x{stackable_size})"
-
-        return {
-            "itemid": item_id,
-            "name": item_name,
-            "category": base.get("category", ""),
-            "lowest_price": lowest_price,
-            "lowest_server": lowest_server,
-            "highest_price": highest_price,
-            "highest_server": highest_server,
-            "average_price": average,
-            "price_difference": highest_price - lowest_price,
-            "server_count": len(server_prices),
-        }
+
+        def _record(name, low, low_s, high, high_s, total, n):
+            return {
+                "itemid": item_id,
+                "name": name,
+                "category": base.category,
+                "lowest_price": low,
+                "lowest_server": low_s,
+                "highest_price": high,
+                "highest_server": high_s,
+                # Rounded at source so neither the UI nor the CSV writer has
+                # to rebuild the row just to tidy this one field
+                "average_price": round(total / n),
+                "price_difference": high - low,
+                "server_count": n,
+            }
+
+        individual = None
+        if ind_n >= 2:
+            individual = _record(base.name, ind_low, ind_low_s,
+                                 ind_high, ind_high_s, ind_sum, ind_n)
+
+        stack = None
+        if stk_n >= 2:
+            stack_name = base.name
+            if base.stackable != "No":
+                stack_name += f" (Stack x{base.stackable})"
+            stack = _record(stack_name, stk_low, stk_low_s,
+                            stk_high, stk_high_s, stk_sum, stk_n)
+
+        return individual, stack
 
 
     def log(self, message: str, level: str = "info") -> None:
-        """Log message (simplified - no UI logging)."""
-        # Could add console logging here if needed
-        pass
+        """Show a log line in the status bar.
+
+        Calls on the Tk thread apply directly; the scrape worker (the ring's
+        single producer) batches through the UI ring, where the drain applies
+        only the newest line per tick. Messages from any other thread are
+        dropped rather than risking a second ring producer - matches the old
+        no-op behaviour for those rare paths.
+        """
+        if _LOG_LEVELS.get(level, 1) < self._log_level:
+            return
+        current = threading.current_thread()
+        if current is threading.main_thread():
+            if self.status is not None:
+                self.status.configure(text=message)
+        elif current is self._worker_thread:
+            self._ui_put(("log", message))
 
     # -----------------------------
     # Organized logging methods
@@ -271,10 +539,9 @@ class MarketMinerGUI:
         """Log scraping startup information."""
         total_items = to_id - from_id + 1
         is_multi = len(server_ids) > 1
-        
+
         if is_multi:
             self.log(f"🚀 Starting cross-server analysis on {len(server_ids)} servers")
-            self.cross_server_tab.clear_results()
         else:
             server_name = next(iter(server_ids.keys()))
             self.log(f"🚀 Starting market scan on {server_name} server")
@@ -289,14 +556,20 @@ class MarketMinerGUI:
         category = row.get("category") or "Unknown"
         rarity = row.get("rarity", "")
         rarity_display = f" [{rarity}]" if rarity and rarity != "Common" else ""
-        
+
         self.log(
             f"💰 {row['name']} - {price_str} in {category}{rarity_display}",
             "success"
         )
 
     def _log_item_skipped(self, item_id: int, name: str, reason: str) -> None:
-        """Log skipped items with consistent format."""
+        """Log skipped items with consistent format.
+
+        Skips are the hot path on sparse ID ranges, so they log at debug and
+        the formatting below is bypassed entirely when filtered.
+        """
+        if _LOG_LEVELS["debug"] < self._log_level:
+            return
         display_name = name if name != "Unknown" else ""
         if display_name:
             reason_friendly = {
@@ -304,14 +577,14 @@ class MarketMinerGUI:
                 "no price found": "no current market price",
                 "failed to fetch or parse": "data unavailable"
             }.get(reason, reason)
-            self.log(f"⏭️ {display_name} - {reason_friendly}", "warning")
+            self.log(f"⏭️ {display_name} - {reason_friendly}", "debug")
         else:
             reason_display = {
                 "no item name": "Item not found in database",
-                "no price found": "No market data available", 
+                "no price found": "No market data available",
                 "failed to fetch or parse": "Unable to retrieve data"
             }.get(reason, reason)
-            self.log(f"⏭️ Item #{item_id} - {reason_display}", "warning")
+            self.log(f"⏭️ Item #{item_id} - {reason_display}", "debug")
 
     def _log_price_comparison(self, cmp_row: dict) -> None:
         """Log cross-server price comparison results."""
@@ -319,7 +592,7 @@ class MarketMinerGUI:
         avg = f"{cmp_row['average_price']:,.0f} gil"
         low_price = f"{cmp_row['lowest_price']:,} gil"
         high_price = f"{cmp_row['highest_price']:,} gil"
-        
+
         self.log(
             f"🔄 {cmp_row['name']} prices: {low_price} on {cmp_row['lowest_server']} → "
             f"{high_price} on {cmp_row['highest_server']} (avg: {avg}, profit: {diff})",
@@ -330,19 +603,20 @@ class MarketMinerGUI:
         """Log completion summary."""
         if items_count > 0:
             self.log(f"📁 Exported {items_count:,} items to {output_file}", "success")
-        
+
         if comparison_count > 0 and cmp_file:
             self.log(f"📁 Saved {comparison_count:,} cross-server opportunities to {cmp_file}", "success")
-        
+
         minutes = int(elapsed // 60)
         seconds = elapsed % 60
         if minutes > 0:
             time_str = f"{minutes}m {seconds:.0f}s"
         else:
             time_str = f"{elapsed:.1f}s"
-        
+
         self.log(f"✅ Market analysis complete! Finished in {time_str}", "success")
-        self.progress_tab.progress_var.set("Analysis Complete! 🎉")
+        # Called from the worker, so the status label goes through the ring
+        self._ui_put(("status", "Analysis Complete! 🎉"))
 
     # -----------------------------
     # Start/stop + worker
@@ -359,9 +633,9 @@ class MarketMinerGUI:
                 messagebox.showerror(
                     "Error", "From ID must be less than To ID")
                 return
-            if not (1 <= max_threads <= 10):
+            if not (1 <= max_threads <= MAX_WORKERS):
                 messagebox.showerror(
-                    "Error", "Thread count must be between 1 and 10")
+                    "Error", f"Thread count must be between 1 and {MAX_WORKERS}")
                 return
 
         except ValueError:
@@ -373,437 +647,733 @@ class MarketMinerGUI:
             messagebox.showerror("Error", "Select at least one server.")
             return
 
-        # Persist last-used server
+        # Resolve server names -> IDs while still on the Tk thread
+        server_ids: Dict[str, int] = {}
+        for name in selected_servers:
+            if name in SERVERS:
+                server_ids[name] = SERVERS[name]
+            else:
+                self.log(f"❌ Server '{name}' not recognized", "error")
+        if not server_ids:
+            messagebox.showerror("Error", "No valid servers selected.")
+            return
+
+        # Persist last-used server (debounced so the UI thread never blocks on disk)
         self._user_config["last_server"] = selected_servers[0]
-        save_config(self._user_config)
+        self._schedule_config_save()
 
         # UI state
         self.is_running = True
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
 
-        threading.Thread(target=self.scrape_worker, daemon=True).start()
+        # A fresh Start means the user wants current prices
+        self.scraper.clear_cache()
+
+        # Snapshot everything the worker needs; it never touches Tk state
+        ctx = RunContext(
+            from_id=from_id,
+            to_id=to_id,
+            max_threads=max_threads,
+            output_file=self.config_panel.get_output_file().strip() or "items.csv",
+            server_ids=server_ids,
+            is_multi=len(server_ids) > 1,
+        )
+
+        # Clearing the comparison table is a Tk call, so it happens here on
+        # the main thread before the worker is spawned
+        if ctx.is_multi:
+            self.cross_server_tab.clear_results()
+
+        self._worker_thread = threading.Thread(
+            target=self.scrape_worker, args=(ctx,), daemon=True)
+        self._worker_thread.start()
+
+        # Wake the drain loop for the duration of this run
+        if not self._drain_running:
+            self._drain_running = True
+            self.root.after(100, self._drain_ui_queue)
 
     def stop_scraping(self) -> None:
         """Signal the worker to stop and disable the Stop button."""
         self.is_running = False
         if self.executor:
+            # Cancel queued work; the executor is rebuilt on the next start
             self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            self._executor_size = None
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.log("🛑 Stopping market analysis...", "warning")
 
-    def scrape_worker(self) -> None:
+    def _on_close(self) -> None:
+        """Shut down background work before destroying the window."""
+        self.is_running = False
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.scraper.close()
+        self.root.destroy()
+
+    def scrape_worker(self, ctx: RunContext) -> None:
         """Background worker that coordinates scraping and saving."""
+        stop_flusher = None
+        flush_skips = None
+        flush_valid = None
+        csv_fh = None
+        cmp_fh = None
+        store = None
         try:
-            from_id = int(self.config_panel.from_var.get())
-            to_id = int(self.config_panel.to_var.get())
-            max_threads = int(self.config_panel.thread_var.get())
-            output_file = self.config_panel.get_output_file().strip() or "items.csv"
-
-            # Skipped items file - single file for all runs
-            skipped_path = os.path.join(os.path.dirname(
-                output_file) or ".", "skipped_items.json")
-
-            # Load existing skipped items to avoid re-checking them
+            from_id = ctx.from_id
+            to_id = ctx.to_id
+            max_threads = ctx.max_threads
+            output_file = ctx.output_file
+
+            # Output directory is resolved and created exactly once per run;
+            # every later writer assumes it exists
+            out_dir = os.path.dirname(output_file) or "."
+            os.makedirs(out_dir, exist_ok=True)
+            # The comparison CSV always lands under output/
+            os.makedirs("output", exist_ok=True)
+
+            # Skipped items file - single consolidated JSON for all runs. The
+            # JSONL sidecar from older versions is still replayed on load but
+            # no longer written; durability comes from the periodic flusher.
+            skipped_dir = out_dir
+            skipped_path = os.path.join(skipped_dir, "skipped_items.json")
+            skipped_log_path = os.path.join(skipped_dir, "skipped_items.jsonl")
+
+            # Load existing skipped items to avoid re-checking them. The
+            # in-memory dict is authoritative for the rest of the run.
             known_skipped = {}
             if os.path.exists(skipped_path):
                 try:
-                    with open(skipped_path, "r", encoding="utf-8") as f:
-                        known_skipped = json.load(f) or {}
+                    if orjson is not None:
+                        with open(skipped_path, "rb") as f:
+                            known_skipped = orjson.loads(f.read()) or {}
+                    else:
+                        with open(skipped_path, "r", encoding="utf-8") as f:
+                            known_skipped = json.load(f) or {}
                     self.log(f"📋 Loaded {len(known_skipped)} previously skipped items")
                 except Exception as e:
                     self.log(f"⚠️ Could not load skipped items: {e}", "warning")
                     known_skipped = {}
 
+            # Replay sidecar entries left over from an older version's
+            # interrupted run; they get folded into the next consolidation
+            replayed_sidecar = False
+            if os.path.exists(skipped_log_path):
+                with suppress(OSError, ValueError):
+                    with open(skipped_log_path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            line = line.strip()
+                            if line:
+                                entry = json.loads(line)
+                                known_skipped[str(entry["itemid"])] = entry
+                                replayed_sidecar = True
+
+            # Int key set for the hot membership test - avoids a str() per id
+            known_skipped_ids = {int(k) for k in known_skipped}
+
+            skip_lock = threading.Lock()
+            skips_dirty = replayed_sidecar
+
             def save_skip(item_id, name, reason):
-                """Append/merge one skipped item into skipped_items.json."""
+                """Record one skipped item in memory; the flusher persists it."""
+                nonlocal skips_dirty
                 try:
-                    data = {}
-                    if os.path.exists(skipped_path):
-                        with open(skipped_path, "r", encoding="utf-8") as f:
-                            data = json.load(f) or {}
                     key = str(item_id)
                     name = name or "Unknown"
-                    entry = data.get(
-                        key, {"itemid": item_id, "name": name, "reason": reason})
-
-                    if entry.get("name", "Unknown") == "Unknown" and name != "Unknown":
-                        entry["name"] = name
-
-                    existing = entry.get("reason", "")
-                    parts = [p.strip() for p in existing.split(
-                        ";") if p.strip()] if existing else []
-                    if reason not in parts:
-                        parts.append(reason)
-                    entry["reason"] = "; ".join(parts)
-
-                    data[key] = entry
-                    os.makedirs(os.path.dirname(skipped_path)
-                                or ".", exist_ok=True)
-                    with open(skipped_path, "w", encoding="utf-8") as f:
-                        json.dump(data, f, ensure_ascii=False,
-                                  indent=2, sort_keys=True)
-                except Exception as e:
+                    with skip_lock:
+                        entry = known_skipped.get(key)
+                        if entry is None:
+                            entry = {"itemid": item_id,
+                                     "name": name, "reason": reason}
+                            known_skipped[key] = entry
+                        else:
+                            if entry.get("name", "Unknown") == "Unknown" and name != "Unknown":
+                                entry["name"] = name
+                            existing = entry.get("reason", "")
+                            parts = [p.strip() for p in existing.split(
+                                ";") if p.strip()] if existing else []
+                            if reason not in parts:
+                                parts.append(reason)
+                            entry["reason"] = "; ".join(parts)
+                        known_skipped_ids.add(int(item_id))
+                        skips_dirty = True
+                except (OSError, ValueError) as e:
+                    # Only swallow IO/JSON trouble; logic errors should surface
                     self.log(f"⚠️ Could not save skip info for item #{item_id}: {e}", "error")
 
-            selected_servers = self.config_panel.get_selected_servers()
-            is_multi = self._is_multi_server()
+            def flush_skips():
+                """Consolidate the in-memory skip index into skipped_items.json.
 
-            # Validate server names -> IDs
-            server_ids: Dict[str, int] = {}
-            for name in selected_servers:
-                if name in SERVERS:
-                    server_ids[name] = SERVERS[name]
-                else:
-                    self.log(f"❌ Server '{name}' not recognized", "error")
+                Writes to a temp file and os.replace()s it into place so a
+                crash mid-flush never corrupts the index.
+                """
+                nonlocal skips_dirty
+                try:
+                    with skip_lock:
+                        if not skips_dirty:
+                            return
+                        # Working file: compact JSON - pretty-printing and key
+                        # sorting get expensive once the skip set grows large
+                        tmp_path = skipped_path + ".tmp"
+                        if orjson is not None:
+                            with open(tmp_path, "wb") as f:
+                                f.write(orjson.dumps(known_skipped))
+                        else:
+                            with open(tmp_path, "w", encoding="utf-8") as f:
+                                json.dump(known_skipped, f, ensure_ascii=False,
+                                          separators=(",", ":"))
+                        os.replace(tmp_path, skipped_path)
+                        skips_dirty = False
+                except (OSError, ValueError) as e:
+                    self.log(f"⚠️ Could not flush skipped items: {e}", "error")
+
+            # Flush the skip index every few seconds instead of touching disk
+            # on every save_skip() call
+            stop_flusher = threading.Event()
+
+            def _skip_flusher():
+                while not stop_flusher.wait(5.0):
+                    flush_skips()
+
+            skip_flusher = threading.Thread(
+                target=_skip_flusher, name="skip-flusher", daemon=True)
+            skip_flusher.start()
+
+            # Validated (sellable) items cache - lets warm multi-server runs
+            # fan out to every server directly for ids proven sellable on a
+            # previous scan instead of re-running the validation phase
+            valid_path = os.path.join(skipped_dir, "valid_items.json")
+            valid_ids: set = set()
+            if os.path.exists(valid_path):
+                with suppress(OSError, ValueError):
+                    if orjson is not None:
+                        with open(valid_path, "rb") as f:
+                            loaded = orjson.loads(f.read())
+                    else:
+                        with open(valid_path, "r", encoding="utf-8") as f:
+                            loaded = json.load(f)
+                    valid_ids = {int(i) for i in loaded or ()}
+                if valid_ids:
+                    self.log(f"📋 Loaded {len(valid_ids)} previously validated items")
+
+            def flush_valid():
+                """Persist the validated-id set next to the skip index."""
+                try:
+                    payload = sorted(valid_ids)
+                    if orjson is not None:
+                        with open(valid_path, "wb") as f:
+                            f.write(orjson.dumps(payload))
+                    else:
+                        with open(valid_path, "w", encoding="utf-8") as f:
+                            json.dump(payload, f, separators=(",", ":"))
+                except (OSError, ValueError) as e:
+                    self.log(f"⚠️ Could not flush validated items: {e}", "error")
 
-            if not server_ids:
-                messagebox.showerror("Error", "No valid servers selected.")
-                return
+            server_ids = ctx.server_ids
+            is_multi = ctx.is_multi
+
+            # Materialize the (name, id) pairs once instead of re-iterating
+            # the dict view inside the submission loops
+            server_items = tuple(server_ids.items())
 
             total_items = to_id - from_id + 1
-            total_jobs = total_items * max(1, len(server_ids))
             processed_jobs = 0
             found_items = 0
-            start_ts = time.time()
+            # Monotonic integer clock: immune to wall-clock jumps, and rate/
+            # ETA stay in integer arithmetic until display
+            start_ns = time.monotonic_ns()
+
+            # Reset UI progress (via the ring - this is the worker thread)
+            self._ui_put(("bar", 0.0))
 
-            # Reset UI progress
-            self.progress_tab.progress_bar.set(0)
-            
             # Set scraping status
             if is_multi:
-                self.progress_tab.progress_var.set(f"Scraping {len(server_ids)} servers...")
+                self._ui_put(("status", f"Scraping {len(server_ids)} servers..."))
             else:
                 server_name = list(server_ids.keys())[0]
-                self.progress_tab.progress_var.set(f"Scraping {server_name}...")
-            
+                self._ui_put(("status", f"Scraping {server_name}..."))
+
             # Log startup information
             self._log_scrape_start(server_ids, from_id, to_id, max_threads, output_file)
 
-            # Data sinks
-            items_data: List[dict] = []
-            comparison_data: List[dict] = []
-            per_item_bucket = {i: [] for i in range(
-                from_id, to_id + 1)} if is_multi else None
-
-            with ThreadPoolExecutor(max_workers=max_threads) as executor:
-                self.executor = executor
-
-                # Submit tasks
-                if is_multi:
-                    # For multi-server: validate each item ID exists first, then query all servers
-                    validated_items = set()
-                    validation_server = next(iter(server_ids.items()))  # Pick first server for validation
-                    val_sname, val_sid = validation_server
-                    
-                    # Phase 1: Filter out known skipped items, then validate remaining
-                    items_to_check = []
-                    for item_id in range(from_id, to_id + 1):
-                        if str(item_id) in known_skipped:
-                            # Already know this item should be skipped
-                            skip_info = known_skipped[str(item_id)]
-                            self._log_item_skipped(item_id, skip_info.get("name", "Unknown"), f"previously skipped: {skip_info.get('reason', 'unknown')}")
-                            processed_jobs += 1
-                        else:
-                            items_to_check.append(item_id)
-                    
-                    self.log(f"⏭️ Auto-skipped {len(range(from_id, to_id + 1)) - len(items_to_check)} previously known items")
-                    
-                    validation_futures = {
-                        executor.submit(self.scraper.get_item_data, item_id, val_sid): item_id
-                        for item_id in items_to_check
-                    }
-                    
-                    for val_fut in as_completed(validation_futures):
-                        if not self.is_running:
-                            break
-                        
-                        item_id = validation_futures[val_fut]
-                        processed_jobs += 1
-                        try:
-                            result = val_fut.result()
-                            if result and result.get("name") != "Unknown":
-                                # Check if item is sellable - if not, skip all servers
-                                rarity = result.get("rarity", "")
-                                if any(flag in rarity for flag in ["Exclusive", "No Auction", "No Sale"]):
-                                    # Item exists but not sellable - skip all servers
-                                    self._log_item_skipped(item_id, result.get("name", "Unknown"), "non-sellable/non-tradeable")
-                                    save_skip(item_id, result.get("name", "Unknown"), "non-sellable/non-tradeable")
+            # Data sinks. Buckets exist only for items currently in flight:
+            # created on first row, deleted as soon as their comparisons are
+            # emitted, so peak memory tracks concurrent items rather than the
+            # whole scan range.
+            per_item_bucket: Dict[int, list] = {} if is_multi else None
+
+            def _bucket(item_id: int) -> list:
+                """Rows collected so far for one in-flight item id."""
+                bucket = per_item_bucket.get(item_id)
+                if bucket is None:
+                    bucket = per_item_bucket[item_id] = []
+                return bucket
+
+            # Stream found rows straight to the output CSV instead of holding
+            # the whole run in memory. The dedup index holds only keys (no
+            # full rows); a re-scraped key still appends its fresh row and
+            # the end-of-run rewrite keeps the last occurrence per key.
+            def _build_merge_index() -> None:
+                """(Re)build the (itemid, server) key set for output_file.
+
+                A file with a foreign column order is rewritten into
+                canonical ITEM_FIELDS order here, before any appending, so
+                every later read can trust the header.
+                """
+                self._row_keys = set()
+                self._rows_path = output_file
+                if not os.path.exists(output_file):
+                    return
+                with suppress(Exception):
+                    foreign_rows = None
+                    with open(output_file, "r", encoding="utf-8", newline="") as f:
+                        # csv.reader + index projection: no per-row dict
+                        # construction the way DictReader does it
+                        reader = csv.reader(f)
+                        header = next(reader, None)
+                        if header is None:
+                            return
+                        # Keys normalize itemid to int here, once, so the
+                        # hot write path can key fresh rows without any
+                        # defensive str()/int() conversions; server names
+                        # are interned so the set shares one str object
+                        # per distinct value
+                        if tuple(header) == ITEM_FIELDS:
+                            for rec in reader:
+                                self._row_keys.add(
+                                    (int(rec[0]), intern(rec[8])))
+                            return
+                        # Foreign column order; resolve indices once
+                        idx = [header.index(k) if k in header else -1
+                               for k in ITEM_FIELDS]
+                        foreign_rows = []
+                        for rec in reader:
+                            vals = [rec[i] if 0 <= i < len(rec) else ""
+                                    for i in idx]
+                            foreign_rows.append(vals)
+                            self._row_keys.add((int(vals[0]), intern(vals[8])))
+                    # Canonicalise the foreign file now so this run can
+                    # append rows in ITEM_FIELDS order
+                    tmp_path = output_file + ".tmp"
+                    with open(tmp_path, "w", encoding="utf-8", newline="",
+                              buffering=1 << 20) as f:
+                        w = csv.writer(f)
+                        w.writerow(ITEM_FIELDS)
+                        w.writerows(foreign_rows)
+                    os.replace(tmp_path, output_file)
+
+            # The index read runs on its own thread so a first run against a
+            # large existing file overlaps the parse with the first in-flight
+            # fetches; repeat runs hit the instance cache and skip it.
+            index_thread = None
+            if self._rows_path != output_file:
+                index_thread = threading.Thread(
+                    target=_build_merge_index, daemon=True)
+                index_thread.start()
+
+            written_items = 0
+            # Rows collect into ~1k batches between writerows calls; the
+            # explicit flush caps data loss on a crash to one batch
+            csv_batch: List[tuple] = []
+
+            # Indexed sibling of the CSV: re-scraped rows upsert in O(1)
+            # against the (itemid, server) primary key, so very large
+            # histories stay mergeable without O(N) rewrites
+            try:
+                store = ItemStore(os.path.join(out_dir, "items.sqlite"))
+            except Exception as e:
+                store = None
+                self.log(f"⚠️ Could not open item store: {e}", "warning")
+
+            def write_item_row(row: dict) -> None:
+                """Stream one found row to the CSV.
+
+                Rows whose key already exists append anyway - the fresh data
+                must reach the file - and flag the end-of-run dedup rewrite,
+                which keeps the last occurrence per key.
+                """
+                nonlocal needs_rewrite, written_items
+                tup = _ROW_GETTER(row)
+                # itemid is already an int and server a str on rows we built
+                key = (tup[0], tup[8])
+                if key in existing_keys:
+                    needs_rewrite = True
+                else:
+                    existing_keys.add(key)
+                csv_batch.append(tup)
+                if len(csv_batch) >= 1000:
+                    csv_writer.writerows(csv_batch)
+                    csv_fh.flush()
+                    csv_batch.clear()
+                if store is not None:
+                    store.add(tup)
+                written_items += 1
+
+            # Comparison rows stream to their own CSV the moment they are
+            # produced; the file opens lazily on the first row so single-hit
+            # runs never create it
+            cmp_writer = None
+            cmp_file = None
+            cmp_count = 0
+
+            def write_cmp_row(cmp_row: dict) -> None:
+                """Stream one cross-server comparison row to the cmp CSV."""
+                nonlocal cmp_fh, cmp_writer, cmp_file, cmp_count
+                if cmp_fh is None:
+                    # Mirror the timestamp of the per-server output file
+                    base_name = os.path.basename(output_file).replace(
+                        "items_", "").replace(".csv", "")
+                    cmp_file = f"output/cross_server_items_{base_name}.csv"
+                    cmp_fh = open(cmp_file, "w", encoding="utf-8",
+                                  newline="", buffering=1 << 20)
+                    cmp_writer = csv.writer(cmp_fh)
+                    cmp_writer.writerow(CMP_FIELDS)
+                cmp_writer.writerow(_CMP_GETTER(cmp_row))
+                cmp_count += 1
+                # Periodic flush so the file stays readable during long
+                # runs without paying a syscall per row
+                if cmp_count % 500 == 0:
+                    cmp_fh.flush()
+
+            # Reuse the executor across runs; only rebuild when the
+            # requested thread count changes
+            if self.executor is None or self._executor_size != max_threads:
+                if self.executor is not None:
+                    self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = ThreadPoolExecutor(
+                    max_workers=max_threads, thread_name_prefix="miner")
+                self._executor_size = max_threads
+            executor = self.executor
+
+
+            # Submission plan. Both modes feed one self-extending completion
+            # loop: a successful validation appends its per-server fan-out
+            # jobs to the same job queue, so there is no barrier between the
+            # validation and scraping phases and the pool never drains while
+            # work remains. Jobs only become futures as the in-flight window
+            # allows, keeping the executor's internal queue bounded instead
+            # of materializing one future per (item, server) up front.
+            pending: set = set()
+            job_queue: deque = deque()  # (item_id, server_name, server_id, is_validation)
+            in_flight_limit = max_threads * 4
+            remaining_servers: tuple = ()
+            validated_items: set = set()
+
+            def _submit(item_id, srv_name, srv_id, is_validation=False):
+                job_queue.append((item_id, srv_name, srv_id, is_validation))
+
+            def _refill():
+                """Top the in-flight window back up from the job queue."""
+                while job_queue and len(pending) < in_flight_limit:
+                    item_id, srv_name, srv_id, is_validation = job_queue.popleft()
+                    fut = executor.submit(
+                        self.scraper.get_item_data, item_id, srv_id)
+                    # Tag the future directly rather than keeping a side
+                    # dict keyed by future objects
+                    fut.key = (item_id, srv_name, is_validation)
+                    pending.add(fut)
+
+            if is_multi:
+                # Multi-server: validate each item ID against one server
+                # first, then fan out to the rest as validations succeed
+                val_sname, val_sid = server_items[0]
+                remaining_servers = tuple(
+                    pair for pair in server_items if pair[0] != val_sname)
+
+                # Drop known-skipped ids, and let ids already proven sellable
+                # on a previous run skip validation entirely. Intersections
+                # scan the (small) persisted indexes rather than materializing
+                # a set of the full id range.
+                skipped_known = {
+                    i for i in known_skipped_ids if from_id <= i <= to_id}
+                pre_validated = {
+                    i for i in valid_ids
+                    if from_id <= i <= to_id and i not in known_skipped_ids}
+                items_to_check = [
+                    i for i in range(from_id, to_id + 1)
+                    if i not in known_skipped_ids and i not in pre_validated]
+                validated_items = set(pre_validated)
+                for item_id in sorted(skipped_known):
+                    skip_info = known_skipped[str(item_id)]
+                    self._log_item_skipped(item_id, skip_info.get("name", "Unknown"), f"previously skipped: {skip_info.get('reason', 'unknown')}")
+                processed_jobs += len(skipped_known)
+
+                self.log(f"⏭️ Auto-skipped {len(skipped_known)} previously known items")
+                if pre_validated:
+                    self.log(f"⚡ {len(pre_validated)} items pre-validated from a previous run")
+
+                for item_id in items_to_check:
+                    _submit(item_id, val_sname, val_sid, is_validation=True)
+                # Pre-validated ids go straight to every server, including
+                # the validation server they never revisit
+                for item_id in sorted(pre_validated):
+                    _submit(item_id, val_sname, val_sid)
+                    for r_sname, r_sid in remaining_servers:
+                        _submit(item_id, r_sname, r_sid)
+            else:
+                # Single server mode - also skip known items
+                sname, sid = server_items[0]
+
+                skipped_known = {
+                    i for i in known_skipped_ids if from_id <= i <= to_id}
+                items_to_check = [
+                    i for i in range(from_id, to_id + 1)
+                    if i not in known_skipped_ids]
+                for item_id in sorted(skipped_known):
+                    skip_info = known_skipped[str(item_id)]
+                    self._log_item_skipped(item_id, skip_info.get("name", "Unknown"), f"previously skipped: {skip_info.get('reason', 'unknown')}")
+                processed_jobs += len(skipped_known)
+
+                if skipped_known:
+                    self.log(f"⏭️ Auto-skipped {len(skipped_known)} previously known items")
+
+                for item_id in items_to_check:
+                    _submit(item_id, sname, sid)
+
+            last_ui_ns = 0
+            # EMA state for the displayed scrape rate
+            rate_ema = None
+            rate_mark_ns = start_ns
+            rate_mark_jobs = 0
+            _refill()
+
+            # First fetches are now in flight; finish the merge index and
+            # open the output file before any completion needs to write
+            if index_thread is not None:
+                index_thread.join()
+            existing_keys = self._row_keys
+            csv_fh = open(output_file, "a" if existing_keys else "w",
+                          encoding="utf-8", newline="", buffering=1 << 20)
+            csv_writer = csv.writer(csv_fh)
+            if not existing_keys:
+                csv_writer.writerow(ITEM_FIELDS)
+            needs_rewrite = False
+
+            while pending and self.is_running:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    # Stop cancels queued futures via shutdown(); their
+                    # result() raises CancelledError, which must not be
+                    # recorded as a validation failure in the skip index
+                    if fut.cancelled():
+                        continue
+                    item_id, sname, is_validation = fut.key
+                    processed_jobs += 1
+
+                    try:
+                        result = fut.result()
+
+                        if is_validation:
+                            # The scraper fills every field with a default,
+                            # so bind the hot ones once instead of paying a
+                            # .get() with fallback per use
+                            name = result["name"] if result else "Unknown"
+                            if result and name != "Unknown":
+                                # Item exists but not sellable - skip all servers
+                                if _is_non_sellable(result["rarity"]):
+                                    self._log_item_skipped(item_id, name, "non-sellable/non-tradeable")
+                                    save_skip(item_id, name, "non-sellable/non-tradeable")
                                     continue
-                                
+
                                 validated_items.add(item_id)
-                                # Process the validation server result immediately
-                                row = dict(result)
-                                row["server"] = val_sname
-                                if row.get("price", 0) > 0:
+                                valid_ids.add(item_id)
+                                # Fan out to the other servers right away
+                                for r_sname, r_sid in remaining_servers:
+                                    _submit(item_id, r_sname, r_sid)
+
+                                # Process the validation server result
+                                # immediately. The result dict is fresh from
+                                # the scraper, so stamp the server on it
+                                # directly instead of copying.
+                                row = result
+                                row["server"] = sname
+                                if row["price"] > 0:
                                     found_items += 1
                                     self._log_item_found(item_id, row)
-                                    self.results_tab.add_row(row)
-                                    items_data.append({
-                                        "itemid": row.get("itemid", ""),
-                                        "name": row.get("name", ""),
-                                        "price": row.get("price", 0),
-                                        "stack_price": row.get("stack_price", 0),
-                                        "sold_per_day": row.get("sold_per_day", 0),
-                                        "stack_sold_per_day": row.get("stack_sold_per_day", 0),
-                                        "category": row.get("category", ""),
-                                        "stackable": row.get("stackable", "No"),
-                                        "server": val_sname
-                                    })
-                                    per_item_bucket[item_id].append(row)
+                                    self._ui_put(("row", row))
+                                    write_item_row(row)
+                                    _bucket(item_id).append(_bucket_row(row))
                                 else:
-                                    rarity = row.get("rarity", "")
-                                    if any(flag in rarity for flag in ["Exclusive", "No Auction", "No Sale"]):
-                                        skip_reason = "non-sellable/non-tradeable"
-                                    else:
-                                        skip_reason = "no price found"
-                                    self._log_item_skipped(item_id, row.get("name", "Unknown"), skip_reason)
-                                    save_skip(item_id, row.get("name", "Unknown"), skip_reason)
+                                    skip_reason = _classify_unpriced(row)
+                                    self._log_item_skipped(item_id, name, skip_reason)
+                                    save_skip(item_id, name, skip_reason)
                             else:
                                 # Invalid item ID - skip entirely
                                 self._log_item_skipped(item_id, "Unknown", "item does not exist")
                                 save_skip(item_id, "Unknown", "item does not exist")
-                        except Exception as e:
-                            self._log_item_skipped(item_id, "Unknown", f"validation error: {e}")
-                            save_skip(item_id, "Unknown", f"validation error: {e}")
-                        
-                        # Update progress during validation
-                        time.sleep(0.05)
-                        current_total = total_items + len(validated_items) * (len(server_ids) - 1)
-                        progress = processed_jobs / max(current_total, processed_jobs)
-                        
-                        # Update progress components individually
-                        self.progress_tab.progress_bar.set(progress)
-                        self.progress_tab.processed_label.configure(text=f"{processed_jobs}/{current_total}")
-                        
-                        elapsed = time.time() - start_ts
-                        rate = (processed_jobs / elapsed * 60) if elapsed > 0 else 0
-                        self.progress_tab.rate_label.configure(text=f"{rate:.1f}/min")
-                        
-                        # Calculate ETA
-                        remaining_jobs = current_total - processed_jobs
-                        if rate > 0 and remaining_jobs > 0:
-                            eta_seconds = (remaining_jobs / rate) * 60
-                            eta_text = self._format_eta(eta_seconds)
-                        else:
-                            eta_text = "--:--"
-                        self.progress_tab.eta_label.configure(text=eta_text)
-                    
-                    # Phase 2: Query remaining servers for validated items only
-                    remaining_servers = [(sname, sid) for sname, sid in server_ids.items() if sname != val_sname]
-                    if validated_items and remaining_servers:
-                        fut_to_key = {
-                            executor.submit(self.scraper.get_item_data, item_id, sid): (item_id, sname)
-                            for item_id in validated_items
-                            for sname, sid in remaining_servers
-                        }
-                    else:
-                        fut_to_key = {}  # No additional queries needed
-                    
-                    # Update total jobs count: validation phase + remaining servers for validated items  
-                    total_jobs = total_items + len(validated_items) * (len(server_ids) - 1)
-                else:
-                    # Single server mode - also skip known items
-                    sname, sid = next(iter(server_ids.items()))
-                    
-                    items_to_check = []
-                    for item_id in range(from_id, to_id + 1):
-                        if str(item_id) in known_skipped:
-                            skip_info = known_skipped[str(item_id)]
-                            self._log_item_skipped(item_id, skip_info.get("name", "Unknown"), f"previously skipped: {skip_info.get('reason', 'unknown')}")
-                            processed_jobs += 1
-                        else:
-                            items_to_check.append(item_id)
-                    
-                    if items_to_check != list(range(from_id, to_id + 1)):
-                        self.log(f"⏭️ Auto-skipped {len(range(from_id, to_id + 1)) - len(items_to_check)} previously known items")
-                    
-                    fut_to_key = {
-                        executor.submit(self.scraper.get_item_data, item_id, sid): (item_id, sname)
-                        for item_id in items_to_check
-                    }
-
-                for fut in as_completed(fut_to_key):
-                    if not self.is_running:
-                        break
-
-                    item_id, sname = fut_to_key[fut]
-                    processed_jobs += 1
-
-                    try:
-                        result = fut.result()
-                        # Be polite to the target site
-                        time.sleep(0.05)
-
-                        if result:
-
-                            row = dict(result)
+                        elif result:
+                            # Fresh dict per call, so annotate in place
+                            row = result
                             row["server"] = sname
+                            name = row["name"]
 
                             # Skip unknown-name rows for display
-                            if row.get("name") == "Unknown":
-                                    self._log_item_skipped(item_id, "Unknown", "no item name")
-                                    save_skip(item_id, "Unknown", "no item name")
-                                    continue
+                            if name == "Unknown":
+                                self._log_item_skipped(item_id, "Unknown", "no item name")
+                                save_skip(item_id, "Unknown", "no item name")
+                                continue
 
                             # Only process items with valid prices
-                            if row.get("price", 0) > 0:
+                            if row["price"] > 0:
                                 found_items += 1
                                 self._log_item_found(item_id, row)
                                 # Show per-server result
-                                self.results_tab.add_row(row)
+                                self._ui_put(("row", row))
                             else:
-                                    # Determine skip reason based on item properties
-                                    rarity = row.get("rarity", "")
-                                    if any(flag in rarity for flag in ["Exclusive", "No Auction", "No Sale"]):
-                                        skip_reason = "non-sellable/non-tradeable"
-                                    else:
-                                        skip_reason = "no price found"
-                                    
-                                    self._log_item_skipped(item_id, row.get("name","Unknown"), skip_reason)
-                                    save_skip(item_id, row.get("name","Unknown"), skip_reason)
-                                    continue
+                                skip_reason = _classify_unpriced(row)
+                                self._log_item_skipped(item_id, name, skip_reason)
+                                save_skip(item_id, name, skip_reason)
+                                continue
 
-                            # Accumulate for CSV
-                            items_data.append(
-                                {
-                                    "itemid": row.get("itemid", ""),
-                                    "name": row.get("name", ""),
-                                    "price": row.get("price", ""),
-                                    "stack_price": row.get("stack_price", ""),
-                                    "sold_per_day": row.get("sold_per_day", ""),
-                                    "stack_sold_per_day": row.get("stack_sold_per_day", ""),
-                                    "category": row.get("category", ""),
-                                    "stackable": row.get("stackable", "No"),
-                                    "server": sname,
-                                }
-                            )
+                            # Stream to the output CSV
+                            write_item_row(row)
 
                             # Cross-server compare once all server rows for this item are in
                             if is_multi:
-                                per_item_bucket[item_id].append(row)
-                                if len(per_item_bucket[item_id]) == len(server_ids):
-                                    # Generate comparison for individual prices
-                                    cmp_row = self._compute_comparison(
-                                        item_id, per_item_bucket[item_id], "individual")
-                                    if cmp_row:
-                                        self.cross_server_tab.add_comparison_row(cmp_row)
-                                        comparison_data.append(cmp_row)
-                                        self._log_price_comparison(cmp_row)
-                                    
-                                    # Generate separate comparison for stack prices if available
-                                    stack_cmp_row = self._compute_comparison(
-                                        item_id, per_item_bucket[item_id], "stack")
-                                    if stack_cmp_row:
-                                        self.cross_server_tab.add_comparison_row(stack_cmp_row)
-                                        comparison_data.append(stack_cmp_row)
-                                        self._log_price_comparison(stack_cmp_row)
+                                bucket = _bucket(item_id)
+                                bucket.append(_bucket_row(row))
+                                if len(bucket) == len(server_ids):
+                                    # Individual and stack comparisons come
+                                    # out of one scan over the bucket
+                                    for cmp_row in self._compute_comparisons_pair(item_id, bucket):
+                                        if cmp_row:
+                                            self._ui_put(("cmp", cmp_row))
+                                            write_cmp_row(cmp_row)
+                                            self._log_price_comparison(cmp_row)
+                                    # This item is finished; release its rows
+                                    del per_item_bucket[item_id]
                         else:
                             self._log_item_skipped(item_id, "Unknown", "failed to fetch or parse")
                             save_skip(item_id, "Unknown", "failed to fetch or parse")
 
-                        # Progress UI
-                        elapsed = time.time() - start_ts
-                        rate = (processed_jobs / elapsed) * \
-                            60 if elapsed > 0 else 0
-                        self.progress_tab.progress_bar.set(
-                            processed_jobs / total_jobs)
-                        self.progress_tab.processed_label.configure(
-                            text=f"{processed_jobs}/{total_jobs}")
-                        self.progress_tab.rate_label.configure(
-                            text=f"{rate:.1f}/min")
-                        
-                        # Calculate and display ETA
-                        remaining_jobs = total_jobs - processed_jobs
-                        if rate > 0 and remaining_jobs > 0:
-                            eta_seconds = (remaining_jobs / rate) * 60
-                            eta_text = self._format_eta(eta_seconds)
-                        else:
-                            eta_text = "--:--"
-                        self.progress_tab.eta_label.configure(text=eta_text)
-
                     except Exception as e:
-                        self.log(
-                            f"Error processing item {item_id} ({sname}): {e}", "error")
+                        if is_validation:
+                            self._log_item_skipped(item_id, "Unknown", f"validation error: {e}")
+                            save_skip(item_id, "Unknown", f"validation error: {e}")
+                        else:
+                            self.log(
+                                f"Error processing item {item_id} ({sname}): {e}", "error")
+
+                    # Progress UI, throttled to <=10 Hz; the final completions
+                    # always report so the bar lands on 100%. The denominator
+                    # grows as validations succeed and their fan-out jobs
+                    # enter the plan.
+                    now_ns = time.monotonic_ns()
+                    if now_ns - last_ui_ns < 100_000_000 and pending:
+                        continue
+                    last_ui_ns = now_ns
+
+                    current_total = total_items + \
+                        len(validated_items) * (len(server_ids) - 1)
+                    progress = processed_jobs / max(current_total, processed_jobs)
+
+                    # Smoothed throughput: blend the instantaneous rate since
+                    # the last report into an EMA so the label doesn't jitter
+                    # with every burst of completions
+                    dt_ns = now_ns - rate_mark_ns
+                    if dt_ns > 0:
+                        inst = (processed_jobs - rate_mark_jobs) \
+                            * 60_000_000_000 / dt_ns
+                        rate_ema = inst if rate_ema is None \
+                            else 0.3 * inst + 0.7 * rate_ema
+                    rate_mark_ns = now_ns
+                    rate_mark_jobs = processed_jobs
+
+                    # ETA = remaining * (elapsed / processed); _format_eta
+                    # caches on whole seconds and maps <= 0 to "--:--"
+                    elapsed_ns = max(now_ns - start_ns, 1)
+                    remaining_jobs = current_total - processed_jobs
+                    eta_ns = remaining_jobs * elapsed_ns // max(processed_jobs, 1)
+                    eta_text = self._format_eta(eta_ns // 1_000_000_000)
+                    self._ui_put(("progress", (
+                        progress, processed_jobs, current_total,
+                        rate_ema or 0.0, eta_text)))
+
+                # Replace completed work with queued jobs, including any
+                # fan-outs planned by this batch's validations. Stop tears
+                # the executor down with cancel_futures=True, so submitting
+                # again would raise; fall through to the save path instead.
+                if not self.is_running:
+                    break
+                _refill()
 
             # --- Save CSVs ---
 
-            # 1) Per-server rows: merge by (itemid, server)
-            if items_data:
-                fieldnames = [
-                    "itemid",
-                    "name",
-                    "price",
-                    "stack_price",
-                    "sold_per_day",
-                    "stack_sold_per_day",
-                    "category",
-                    "stackable",
-                    "server",
-                ]
-                existing_rows = []
-                if os.path.exists(output_file):
-                    with suppress(Exception):
-                        with open(output_file, "r", encoding="utf-8", newline="") as f:
-                            existing_rows = list(csv.DictReader(f))
-
-                def _key(row: dict) -> tuple[str, str]:
-                    return (str(row.get("itemid", "")), str(row.get("server", "")))
-
-                merged = {_key(r): r for r in existing_rows}
-                for r in items_data:
-                    merged[_key(r)] = r
-
-                os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
-                with open(output_file, "w", encoding="utf-8", newline="") as f:
-                    w = csv.DictWriter(f, fieldnames=fieldnames)
-                    w.writeheader()
-                    w.writerows(merged.values())
-
-            # 2) Cross-server comparison (only if multi)
-            cmp_file = None
-            if is_multi and comparison_data:
-                # Extract timestamp from output_file to keep filenames consistent
-                base_name = os.path.basename(output_file).replace("items_", "").replace(".csv", "")
-                cmp_file = f"output/cross_server_items_{base_name}.csv"
-                cmp_fields = [
-                    "itemid",
-                    "name",
-                    "category",
-                    "lowest_price",
-                    "lowest_server",
-                    "highest_price",
-                    "highest_server",
-                    "average_price",
-                    "price_difference",
-                    "server_count",
-                ]
-                os.makedirs(os.path.dirname(cmp_file) or ".", exist_ok=True)
-                with open(cmp_file, "w", encoding="utf-8", newline="") as f:
-                    w = csv.DictWriter(f, fieldnames=cmp_fields)
-                    w.writeheader()
-                    for row in comparison_data:
-                        r = dict(row)
-                        r["average_price"] = round(r.get("average_price", 0))
-                        w.writerow(r)
-            elapsed = time.time() - start_ts
-            self.progress_tab.progress_bar.set(1.0)
-            
+            # 1) Per-server rows were streamed as they arrived. If any row
+            #    re-used an existing (itemid, server) key, reconcile the
+            #    file with a single last-wins dedup rewrite.
+            if csv_batch:
+                csv_writer.writerows(csv_batch)
+                csv_batch.clear()
+            csv_fh.close()
+            csv_fh = None
+            if needs_rewrite:
+                # The file holds every version of each colliding key in
+                # arrival order; one streaming re-read keeping the last
+                # occurrence reconciles it without having retained any
+                # rows in memory during the run
+                latest: Dict[tuple, list] = {}
+                with open(output_file, "r", encoding="utf-8", newline="",
+                          buffering=1 << 20) as f:
+                    reader = csv.reader(f)
+                    next(reader, None)
+                    for rec in reader:
+                        latest[(rec[0], rec[8])] = rec
+                tmp_path = output_file + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8", newline="",
+                          buffering=1 << 20) as f:
+                    w = csv.writer(f)
+                    w.writerow(ITEM_FIELDS)
+                    w.writerows(latest.values())
+                os.replace(tmp_path, output_file)
+
+            # 2) Cross-server comparison rows were streamed as they were
+            #    produced; just close the handle if one was opened.
+            if cmp_fh is not None:
+                cmp_fh.close()
+                cmp_fh = None
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
+            self._ui_put(("bar", 1.0))
+
             # Log completion summary
             self._log_completion(
-                len(items_data), 
-                len(comparison_data) if is_multi else 0, 
-                elapsed, 
-                output_file, 
+                written_items,
+                cmp_count,
+                elapsed,
+                output_file,
                 cmp_file
             )
 
         except Exception as e:
             self.log(f"❌ Analysis failed: {e}", "error")
-            messagebox.showerror("Error", f"Scraping failed: {e}")
+            self._ui_put(("error", f"Scraping failed: {e}"))
         finally:
+            if csv_fh is not None:
+                with suppress(OSError):
+                    if csv_batch:
+                        csv_writer.writerows(csv_batch)
+                    csv_fh.close()
+            if cmp_fh is not None:
+                with suppress(OSError):
+                    cmp_fh.close()
+            if store is not None:
+                with suppress(Exception):
+                    store.close()
+            if stop_flusher is not None:
+                stop_flusher.set()
+            if flush_skips is not None:
+                flush_skips()
+                # The old sidecar is folded into the consolidated index now
+                with suppress(OSError):
+                    if os.path.exists(skipped_log_path):
+                        os.remove(skipped_log_path)
+            if flush_valid is not None:
+                flush_valid()
             self.is_running = False
-            self.start_btn.configure(state="normal")
-            self.stop_btn.configure(state="disabled")
-            self.executor = None
+            # Button state flips on the Tk thread; the drain loop keeps
+            # ticking until the ring is empty, so this is always applied
+            self._ui_put(("done", None))
@@ -9,6 +9,10 @@ class ModernTheme:
     """Modern theme configuration using CustomTkinter"""
     
     def __init__(self):
+        # Shared CTkFont instances, created lazily because CTkFont needs a
+        # Tk root; every widget reuses these instead of allocating its own
+        # Tk font object
+        self._fonts = None
         self.colors = {
             'bg': '#212121',
             'card_bg': '#2b2b2b',
@@ -24,6 +28,23 @@ class ModernTheme:
             'border': '#404040'
         }
     
+    @property
+    def fonts(self):
+        """Shared font instances keyed by role."""
+        if self._fonts is None:
+            self._fonts = {
+                'title': ctk.CTkFont(size=20, weight="bold"),
+                'header': ctk.CTkFont(size=18, weight="bold"),
+                'section': ctk.CTkFont(size=16, weight="bold"),
+                'stat': ctk.CTkFont(size=16),
+                'button': ctk.CTkFont(size=12, weight="bold"),
+                'label': ctk.CTkFont(size=12),
+                'caption': ctk.CTkFont(size=11),
+                'small': ctk.CTkFont(size=10),
+                'mono': ctk.CTkFont(family="Consolas", size=11),
+            }
+        return self._fonts
+
     def apply_theme(self, root=None):
         """Apply the modern CustomTkinter theme"""
         ctk.set_appearance_mode("dark")
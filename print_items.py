@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+MarketMiner CSV viewer - inspect scraped item CSVs from the command line or a GUI
+Prints a quick table to stdout by default; --gui opens a sortable/filterable
+Treeview window for larger files
+"""
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+# With Copy-on-Write, boolean indexing and slicing return cheap views until
+# written to, so the viewer never needs defensive full-frame copies
+pd.set_option("mode.copy_on_write", True)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+def _read_csv_fast(path, nrows=None, usecols=None):
+    """
+    Parse a CSV into a DataFrame with the fastest available reader.
+
+    Prefers pyarrow's multithreaded CSV reader; falls back to pandas' C
+    engine. When nrows is set the pandas path reads one chunk and stops so
+    the whole file is never parsed just to show a head.
+    """
+    if HAS_PYARROW:
+        convert = pacsv.ConvertOptions(include_columns=list(usecols)) if usecols else None
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=1 << 20, use_threads=True),
+            convert_options=convert,
+        )
+        if nrows is not None:
+            table = table.slice(0, nrows)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    if nrows is not None:
+        reader = pd.read_csv(
+            path, engine="c", low_memory=False, cache_dates=True,
+            usecols=usecols, chunksize=max(nrows, 100_000),
+        )
+        for chunk in reader:
+            return chunk.head(nrows)
+        return pd.DataFrame(columns=list(usecols) if usecols else None)
+
+    return pd.read_csv(path, engine="c", low_memory=False, cache_dates=True,
+                       usecols=usecols)
+
+
+def _read_csv_mapped(path, usecols=None):
+    """
+    Full-file read tuned for the GUI viewer: memory-map the file and let
+    pyarrow's threaded parser chew it in 8 MiB blocks, keeping Arrow-backed
+    dtypes so null checks stay O(1) bitmap lookups.
+    """
+    if not HAS_PYARROW:
+        return _read_csv_fast(path, usecols=usecols)
+    mm = pa.memory_map(path, "r")
+    convert = pacsv.ConvertOptions(include_columns=list(usecols)) if usecols else None
+    table = pacsv.read_csv(
+        mm, read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=convert)
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+
+def print_csv_file(filename, num_rows=None, columns=None, filter_col=None,
+                   filter_val=None, fmt="plain"):
+    """Print a CSV to stdout, optionally limited to num_rows / columns / a filter."""
+    if not os.path.isfile(filename):
+        print(f"File not found: {filename}", file=sys.stderr)
+        return 1
+
+    # Validate requested names against the header before any real parsing:
+    # a bad name fed into include_columns/usecols would otherwise surface as
+    # a raw pyarrow/pandas traceback instead of a usable message
+    requested = list(columns or [])
+    if filter_col:
+        requested.append(filter_col)
+    if requested:
+        header = pd.read_csv(filename, nrows=0).columns
+        missing = [c for c in requested if c not in header]
+        if missing:
+            print(f"Unknown column(s): {', '.join(missing)}", file=sys.stderr)
+            return 1
+
+    if HAS_PYARROW and filter_col:
+        # Read only the columns we need (display set plus the filter column)
+        # and evaluate the filter on the Arrow table, so rows the filter
+        # discards are never materialized as pandas objects
+        usecols = sorted(set(columns) | {filter_col}) if columns else None
+        convert = pacsv.ConvertOptions(include_columns=usecols) if usecols else None
+        table = pacsv.read_csv(
+            filename,
+            read_options=pacsv.ReadOptions(block_size=1 << 20, use_threads=True),
+            convert_options=convert,
+        )
+        table = table.filter(
+            pc.equal(pc.cast(table[filter_col], pa.string()), pa.scalar(str(filter_val))))
+        if num_rows is not None:
+            table = table.slice(0, num_rows)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        if columns:
+            df = df[list(columns)]
+    elif filter_col and num_rows is not None:
+        # Filtered preview without pyarrow: scan in 100k-row chunks and stop
+        # as soon as enough matches are collected, so the file's tail is
+        # never parsed when the matches come early
+        collected = []
+        matched = 0
+        for chunk in pd.read_csv(filename, engine="c", low_memory=False,
+                                 chunksize=100_000):
+            sub = chunk[chunk[filter_col].astype(str) == str(filter_val)]
+            if len(sub):
+                collected.append(sub)
+                matched += len(sub)
+            if matched >= num_rows:
+                break
+        df = (pd.concat(collected).head(num_rows) if collected
+              else pd.DataFrame(columns=pd.read_csv(filename, nrows=0).columns))
+        if columns:
+            df = df[list(columns)]
+    else:
+        # Projection still goes through the reader; only the fallback filter
+        # path has to post-filter in pandas. An unfiltered row limit already
+        # stops after the first chunk inside _read_csv_fast.
+        usecols = columns if (columns and not filter_col) else None
+        df = _read_csv_fast(filename, nrows=num_rows if not filter_col else None,
+                            usecols=usecols)
+
+        if filter_col:
+            df = df[df[filter_col].astype(str) == str(filter_val)]
+
+        if columns and usecols is None:
+            df = df[list(columns)]
+
+    tabulate = None
+    if fmt == "grid":
+        try:
+            from tabulate import tabulate
+        except ImportError:
+            pass
+    if tabulate is not None:
+        print(tabulate(df, headers="keys", tablefmt="grid", showindex=False))
+    else:
+        # to_string formats through pandas' C paths and truncates wide/long
+        # frames instead of measuring every cell in Python like tabulate
+        print(df.to_string(index=False, max_rows=num_rows, max_cols=12,
+                           line_width=200))
+    print(f"\n{len(df)} row(s)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="View MarketMiner CSV output in the terminal or a GUI")
+    parser.add_argument("filename", nargs="?", default="items.csv",
+                        help="CSV file to view (default: items.csv)")
+    parser.add_argument("-n", "--num-rows", type=int, default=None,
+                        help="limit output to the first N rows")
+    parser.add_argument("-c", "--columns", nargs="+", default=None,
+                        help="only show these columns")
+    parser.add_argument("-f", "--filter", nargs=2, metavar=("COL", "VALUE"),
+                        default=None, help="only show rows where COL equals VALUE")
+    parser.add_argument("--format", choices=("plain", "grid"), default="plain",
+                        help="output style; 'grid' draws tabulate borders")
+    parser.add_argument("--gui", action="store_true",
+                        help="open the file in the GUI viewer")
+    args = parser.parse_args()
+
+    if args.gui:
+        # Deferred so the CLI path never pays the tkinter import cost
+        from print_items_gui import CSVViewer
+        viewer = CSVViewer(args.filename if os.path.isfile(args.filename) else None)
+        viewer.mainloop()
+        return 0
+
+    filter_col, filter_val = args.filter if args.filter else (None, None)
+    return print_csv_file(args.filename, num_rows=args.num_rows,
+                          columns=args.columns, filter_col=filter_col,
+                          filter_val=filter_val, fmt=args.format)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
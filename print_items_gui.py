@@ -0,0 +1,506 @@
+"""
+GUI half of the MarketMiner CSV viewer.
+
+Kept out of print_items.py so the plain CLI path never imports tkinter;
+print_items.main() pulls CSVViewer in only when --gui is passed.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+import pandas as pd
+
+from print_items import HAS_PYARROW, _read_csv_mapped
+
+
+def _is_text_dtype(dt):
+    """True for object, pandas-string, and Arrow-backed string columns."""
+    return (dt == object or isinstance(dt, pd.StringDtype)
+            or (isinstance(dt, pd.ArrowDtype)
+                and str(dt) in ("string[pyarrow]", "large_string[pyarrow]")))
+
+
+class ToolTip:
+    """
+    Hover popup showing the full value of a truncated cell.
+
+    One instance lives for the whole widget: the popup window is created
+    lazily and then recycled via withdraw/deiconify, so hovering never
+    allocates Tk objects or stacks bindings.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.tip = None
+        self.label = None
+
+    def show(self, text, x, y):
+        if self.tip is None:
+            self.tip = tk.Toplevel(self.widget)
+            self.tip.wm_overrideredirect(True)
+            self.label = tk.Label(self.tip, justify=tk.LEFT,
+                                  background="#2b2b2b", foreground="#dce4ee",
+                                  relief=tk.SOLID, borderwidth=1, padx=6, pady=3)
+            self.label.pack()
+        self.label.configure(text=text)
+        self.tip.wm_geometry(f"+{x + 12}+{y + 12}")
+        self.tip.deiconify()
+
+    def hide(self):
+        if self.tip is not None:
+            self.tip.withdraw()
+
+
+class CSVViewer(tk.Tk):
+    """Treeview-based browser for MarketMiner CSV output."""
+
+    # Rows materialized in the Treeview at a time; the window slides as the
+    # user scrolls so huge frames never hit Tk all at once
+    PAGE = 500
+
+    def __init__(self, filename=None):
+        super().__init__()
+        self.title("MarketMiner CSV Viewer")
+        self.geometry("1100x650")
+        self.df = None
+        self.filtered_df = None
+        # Memoized all-string frames: _str_full mirrors the loaded frame,
+        # _str_df the current filter result, so cells are stringified once
+        # per load/filter instead of on every scroll or column toggle
+        self._str_full = None
+        self._str_df = None
+        # Column order cached as a tuple; selection kept as a frozenset so
+        # visibility checks are O(1) instead of list scans
+        self._cols_tuple = ()
+        self.selected_columns = frozenset()
+        self._view = None
+        self.row_window_start = 0
+        # Re-render during a slide resets the scroll position, which fires
+        # the scroll callback again; this flag breaks that feedback loop
+        self._sliding = False
+        # iid -> tuple of cell strings for the materialized window, so hover
+        # lookups never round-trip through Tcl
+        self._row_cache = {}
+        # Parsing happens off the Tk thread; results are installed from the
+        # event loop via after() polling
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._progress = None
+        self._current_file = None
+        self._file_columns = ()
+        self._build_ui()
+        if filename:
+            self.open_file(filename)
+
+    # ---------- UI construction ----------
+
+    def _build_ui(self):
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill=tk.X, padx=6, pady=4)
+
+        ttk.Button(toolbar, text="Open...", command=self._choose_file).pack(side=tk.LEFT)
+
+        ttk.Label(toolbar, text="Filter:").pack(side=tk.LEFT, padx=(12, 2))
+        self.filter_col_var = tk.StringVar()
+        self.filter_combo = ttk.Combobox(toolbar, textvariable=self.filter_col_var,
+                                         width=16, state="readonly")
+        self.filter_combo.pack(side=tk.LEFT)
+        self.filter_val_var = tk.StringVar()
+        ttk.Entry(toolbar, textvariable=self.filter_val_var, width=18).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Apply", command=self.apply_filter).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text="Clear", command=self.clear_filter).pack(side=tk.LEFT, padx=2)
+
+        body = ttk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True, padx=6, pady=(0, 4))
+
+        # Column chooser down the left side, searchable
+        chooser = ttk.Frame(body, width=180)
+        chooser.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 6))
+        ttk.Label(chooser, text="Columns").pack(anchor=tk.W)
+        self.col_search_var = tk.StringVar()
+        search = ttk.Entry(chooser, textvariable=self.col_search_var)
+        search.pack(fill=tk.X, pady=2)
+        search.bind("<KeyRelease>", self._on_col_search)
+        self.col_list_frame = ttk.Frame(chooser)
+        self.col_list_frame.pack(fill=tk.BOTH, expand=True)
+        self._col_vars = {}
+        self._col_widgets = {}
+        self._cols_lower = []
+        self._search_after = None
+
+        table = ttk.Frame(body)
+        table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(table, show="headings")
+        self.ysb = ttk.Scrollbar(table, orient=tk.VERTICAL, command=self.tree.yview)
+        xsb = ttk.Scrollbar(table, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(yscrollcommand=self._on_yscroll, xscrollcommand=xsb.set)
+        self.ysb.pack(side=tk.RIGHT, fill=tk.Y)
+        xsb.pack(side=tk.BOTTOM, fill=tk.X)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self._cell_tooltip = ToolTip(self.tree)
+        self.tree.bind("<Motion>", self._on_motion)
+        self.tree.bind("<Leave>", lambda e: self._cell_tooltip.hide())
+        self.tree.bind("<Double-1>", self._inspect_row)
+        self.tree.bind("<Prior>", lambda e: self._shift_window(-(self.PAGE // 2)))
+        self.tree.bind("<Next>", lambda e: self._shift_window(self.PAGE // 2))
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        # X11 delivers the wheel as Button-4/5 instead of <MouseWheel>
+        self.tree.bind("<Button-4>", lambda e: self._on_mousewheel(e, -1))
+        self.tree.bind("<Button-5>", lambda e: self._on_mousewheel(e, 1))
+
+        self.status_var = tk.StringVar(value="No file loaded")
+        ttk.Label(self, textvariable=self.status_var, anchor=tk.W).pack(
+            fill=tk.X, padx=6, pady=(0, 4))
+
+    # ---------- File loading ----------
+
+    def _choose_file(self):
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if filename:
+            self.open_file(filename)
+
+    def open_file(self, filename):
+        # A saved column subset is pushed into the parser, so columns the
+        # user hid last session are never tokenized
+        persisted = self._load_view_sidecar(filename)
+        self._show_progress(f"Loading {os.path.basename(filename)}...")
+        fut = self._executor.submit(self._load_frame, filename, persisted)
+        self.after(50, self._poll_load, fut, filename)
+
+    @staticmethod
+    def _load_frame(filename, usecols):
+        """Read the header plus the (possibly projected) frame.
+
+        The cheap header read keeps the full column list available so the
+        chooser can still offer columns excluded from the parse.
+        """
+        header = tuple(pd.read_csv(filename, nrows=0).columns)
+        if usecols:
+            # Drop sidecar names the file no longer has rather than letting
+            # them fail the projected read
+            usecols = [c for c in usecols if c in header]
+        try:
+            df = _read_csv_mapped(filename, usecols or None)
+        except Exception:
+            # A rejected projection must never make the file unopenable
+            df = _read_csv_mapped(filename)
+        return header, df
+
+    @staticmethod
+    def _sidecar_path(filename):
+        return f"{filename}.mmv.json"
+
+    def _load_view_sidecar(self, filename):
+        try:
+            with open(self._sidecar_path(filename), encoding="utf-8") as f:
+                cols = json.load(f).get("columns")
+            return list(cols) if cols else None
+        except (OSError, ValueError):
+            return None
+
+    def _save_view_sidecar(self):
+        if not self._current_file:
+            return
+        path = self._sidecar_path(self._current_file)
+        try:
+            if self.selected_columns >= set(self._file_columns):
+                if os.path.isfile(path):
+                    os.remove(path)
+                return
+            # Persist in file order, including columns not in the current
+            # (projected) parse
+            cols = [c for c in self._file_columns if c in self.selected_columns]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"columns": cols}, f)
+        except OSError:
+            pass
+
+    def _show_progress(self, text):
+        self._progress = tk.Toplevel(self)
+        self._progress.title("Loading")
+        self._progress.transient(self)
+        self._progress.resizable(False, False)
+        ttk.Label(self._progress, text=text).pack(padx=16, pady=(12, 4))
+        bar = ttk.Progressbar(self._progress, mode="indeterminate", length=240)
+        bar.pack(padx=16, pady=(0, 12))
+        bar.start()
+        self._progress.grab_set()
+
+    def _hide_progress(self):
+        if self._progress is not None:
+            self._progress.destroy()
+            self._progress = None
+
+    def _poll_load(self, fut, filename):
+        if not fut.done():
+            self.after(50, self._poll_load, fut, filename)
+            return
+        self._hide_progress()
+        try:
+            header, df = fut.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not read {filename}:\n{e}")
+            return
+        self._install_df(df, filename, header)
+
+    def _install_df(self, df, filename, file_columns=None):
+        self.df = df
+        self._current_file = filename
+        # Full header column list; a projected parse carries only a subset
+        self._file_columns = tuple(file_columns) if file_columns else tuple(df.columns)
+        # Low-cardinality text columns (server names, categories, ...)
+        # become categoricals so filter equality compares integer codes.
+        # The pyarrow load path already yields Arrow-backed strings, so the
+        # check must cover those too, not just object columns; remaining
+        # object columns get Arrow-backed strings to keep comparisons inside
+        # Arrow's compute kernels instead of allocating a str per row.
+        n = len(self.df)
+        for c in self.df.columns:
+            dt = self.df[c].dtype
+            if not _is_text_dtype(dt):
+                continue
+            if n and self.df[c].nunique() < 0.05 * n:
+                self.df[c] = self.df[c].astype("category")
+            elif HAS_PYARROW and dt == object:
+                self.df[c] = self.df[c].astype("string[pyarrow]")
+        self.filtered_df = self.df
+        self._str_full = self.df.astype("string").fillna("")
+        self._str_df = self._str_full
+        self._cols_tuple = tuple(self.df.columns)
+        self.selected_columns = frozenset(self._cols_tuple)
+        self.filter_combo["values"] = self._cols_tuple
+        self._rebuild_column_chooser()
+        self.display_df()
+        self.status_var.set(f"{os.path.basename(filename)} - "
+                            f"{len(self.df)} rows, {len(self.df.columns)} columns")
+
+    # ---------- Display ----------
+
+    def display_df(self):
+        # Rows carry every column; hiding/showing columns is a pure
+        # displaycolumns change that never touches the inserted rows
+        cols = self._cols_tuple
+        self.tree["columns"] = cols
+        for c in cols:
+            self.tree.heading(c, text=c)
+        self.tree["displaycolumns"] = self._active_columns()
+        self._view = self._str_df
+        self.row_window_start = 0
+        self._render_window()
+        self.autosize_columns(self._view.iloc[:self.PAGE])
+
+    def _active_columns(self):
+        return tuple(c for c in self._cols_tuple if c in self.selected_columns)
+
+    def _render_window(self):
+        """Materialize the current PAGE-row window of self._view into Tk."""
+        self.tree.delete(*self.tree.get_children())
+        self._row_cache.clear()
+        start = self.row_window_start
+        window = self._view.iloc[start:start + self.PAGE]
+        # Cells are already stringified in the cached frame, so this is a
+        # straight handoff to Tk. Supplying our own iids skips Tk's
+        # per-insert id generation and round-trip of the generated name.
+        insert = self.tree.insert
+        row_cache = self._row_cache
+        for i, row in enumerate(window.to_numpy().tolist()):
+            iid = f"r{i}"
+            insert("", tk.END, iid=iid, values=row)
+            row_cache[iid] = tuple(row)
+
+    def _on_yscroll(self, first, last):
+        self.ysb.set(first, last)
+        if self._view is None or self._sliding:
+            return
+        # Nearing either edge of the materialized window: slide it half a
+        # page that way and re-render instead of ever holding the full frame
+        if (float(last) > 0.9
+                and self.row_window_start + self.PAGE < len(self._view)):
+            self._slide_window(self.PAGE // 2)
+        elif float(first) < 0.1 and self.row_window_start > 0:
+            self._slide_window(-(self.PAGE // 2))
+
+    def _slide_window(self, delta):
+        self._sliding = True
+        top = max(0, len(self._view) - self.PAGE)
+        self.row_window_start = max(0, min(self.row_window_start + delta, top))
+        self._render_window()
+        # Re-anchor mid-window so the edge triggers don't refire immediately
+        # and the rows the user was reading stay roughly in place
+        self.tree.yview_moveto(0.45)
+        # Scroll callbacks queued by the re-render drain before idle;
+        # re-arm edge detection only after they have
+        self.after_idle(lambda: setattr(self, "_sliding", False))
+
+    def _on_mousewheel(self, event, direction=None):
+        if self._view is None:
+            return
+        if direction is None:
+            direction = -1 if event.delta > 0 else 1
+        first, last = self.tree.yview()
+        # At a hard edge the wheel can't move the view, so no scroll
+        # callback fires; shift the window directly
+        if direction < 0 and first <= 0.0 and self.row_window_start > 0:
+            self._slide_window(-(self.PAGE // 2))
+        elif (direction > 0 and last >= 1.0
+                and self.row_window_start + self.PAGE < len(self._view)):
+            self._slide_window(self.PAGE // 2)
+
+    def _shift_window(self, delta):
+        if self._view is None:
+            return
+        top = max(0, len(self._view) - self.PAGE)
+        new_start = max(0, min(self.row_window_start + delta, top))
+        if new_start != self.row_window_start:
+            self.row_window_start = new_start
+            self._render_window()
+
+    def autosize_columns(self, df):
+        import tkinter.font as tkfont
+        font = tkfont.Font(font=("TkDefaultFont", 9))
+        char_px = font.measure("W")
+        for c in df.columns:
+            # max() over zero rows yields NA/nan, not 0
+            m = df[c].str.len().max()
+            maxlen = max(0 if pd.isna(m) else int(m), len(str(c)))
+            width = char_px * maxlen + 24
+            self.tree.column(c, width=min(width, 400), stretch=False)
+
+    # ---------- Filtering ----------
+
+    def apply_filter(self):
+        if self.df is None:
+            return
+        col = self.filter_col_var.get()
+        val = self.filter_val_var.get()
+        if not col or not val:
+            return
+        series = self.df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Categorical equality compares int codes, no string walk
+            mask = series == val
+        else:
+            mask = series.astype(
+                "string[pyarrow]" if HAS_PYARROW else "string") == val
+        self.filtered_df = self.df.loc[mask]
+        self._str_df = self._str_full.loc[mask]
+        self.display_df()
+        self.status_var.set(f"{len(self.filtered_df)} of {len(self.df)} rows match")
+
+    def clear_filter(self):
+        if self.df is None:
+            return
+        self.filter_val_var.set("")
+        self.filtered_df = self.df
+        self._str_df = self._str_full
+        self.display_df()
+        self.status_var.set(f"{len(self.df)} rows")
+
+    # ---------- Column chooser ----------
+
+    def _on_col_search(self, event=None):
+        # Debounce: rebuild once typing pauses instead of on every keystroke
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(120, self._filter_column_chooser)
+
+    def _rebuild_column_chooser(self):
+        """Create one Checkbutton per column; later searches only re-pack."""
+        for child in self.col_list_frame.winfo_children():
+            child.destroy()
+        self._col_vars = {}
+        self._col_widgets = {}
+        self._cols_lower = []
+        if self.df is None:
+            return
+        # Offer every header column, not just the parsed subset, so columns
+        # hidden in a previous session can be brought back
+        for c in self._file_columns:
+            var = tk.BooleanVar(value=c in self.selected_columns)
+            self._col_vars[c] = var
+            self._col_widgets[c] = ttk.Checkbutton(
+                self.col_list_frame, text=str(c), variable=var,
+                command=self._apply_column_selection)
+            self._cols_lower.append((c, str(c).lower()))
+        self._filter_column_chooser()
+
+    def _filter_column_chooser(self):
+        self._search_after = None
+        needle = self.col_search_var.get().lower()
+        # Re-packing a managed widget appends it, so packing matches in
+        # column order keeps the list ordered without destroy/create churn
+        for c, lower in self._cols_lower:
+            if needle and needle not in lower:
+                self._col_widgets[c].pack_forget()
+            else:
+                self._col_widgets[c].pack(anchor=tk.W)
+
+    def _apply_column_selection(self):
+        self.selected_columns = frozenset(
+            c for c, var in self._col_vars.items() if var.get())
+        self._save_view_sidecar()
+        if any(c not in self._cols_tuple for c in self.selected_columns):
+            # A column excluded from the projected parse was re-enabled;
+            # reload with the widened subset just written to the sidecar
+            if self._current_file:
+                self.open_file(self._current_file)
+            return
+        if self._str_df is not None:
+            self.tree.configure(displaycolumns=self._active_columns())
+
+    # ---------- Tooltips / inspection ----------
+
+    def _on_motion(self, event):
+        rowid = self.tree.identify_row(event.y)
+        colid = self.tree.identify_column(event.x)
+        if not rowid or not colid:
+            self._cell_tooltip.hide()
+            return
+        # identify_column numbers displayed columns; map back to the data column
+        colname = self.tree.column(colid, "id")
+        idx = self._cols_tuple.index(colname) if colname in self._cols_tuple else -1
+        values = self._row_cache.get(rowid)
+        if values is None or idx < 0 or idx >= len(values):
+            self._cell_tooltip.hide()
+            return
+        text = values[idx]
+        if len(text) < 24:
+            self._cell_tooltip.hide()
+            return
+        self._cell_tooltip.show(text, event.x_root, event.y_root)
+
+    def _inspect_row(self, event):
+        rowid = self.tree.identify_row(event.y)
+        if not rowid:
+            return
+        values = self._row_cache.get(rowid) or self.tree.item(rowid, "values")
+        win = tk.Toplevel(self)
+        win.title("Row details")
+        win.geometry("520x400")
+        # One two-column Treeview instead of a Label+Text pair per field;
+        # a wide row costs one widget, not hundreds
+        tv = ttk.Treeview(win, columns=("field", "value"), show="headings")
+        tv.heading("field", text="Field")
+        tv.heading("value", text="Value")
+        tv.column("field", width=160, stretch=False)
+        ysb = ttk.Scrollbar(win, orient=tk.VERTICAL, command=tv.yview)
+        tv.configure(yscrollcommand=ysb.set)
+        ysb.pack(side=tk.RIGHT, fill=tk.Y)
+        tv.pack(fill=tk.BOTH, expand=True)
+        insert = tv.insert
+        for c, v in zip(self._cols_tuple, values):
+            insert("", tk.END, values=(c, v))
+
+        def copy_selection(_event=None):
+            sel = tv.selection()
+            if sel:
+                text = "\n".join(
+                    "\t".join(tv.item(iid, "values")) for iid in sel)
+                win.clipboard_clear()
+                win.clipboard_append(text)
+
+        tv.bind("<Control-c>", copy_selection)